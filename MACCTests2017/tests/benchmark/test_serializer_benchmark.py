@@ -0,0 +1,146 @@
+"""
+Throughput and memory benchmark of PcsaPostSerializer on lists of posts
+
+At each size of MACC_SERIALIZER_SIZES the posts of one owner are
+
+- serialized with PcsaPostSerializer(many=True) and JSONRenderer
+- serialized with project_posts, a read-only path building the dicts
+  from values_list() instead of model instances and serializer fields
+- parsed with JSONParser and validated with PcsaPostSerializer(many=True)
+
+Both serialization paths must render the same json. The throughput of
+each step is printed in posts per second, with the peak memory it
+allocated when tracemalloc is available (Python 3).
+
+The benchmark only runs when MACC_BENCHMARK is set::
+
+	$ MACC_BENCHMARK=1 pytest -s tests/benchmark/test_serializer_benchmark.py
+
+Other settings
+
+	MACC_SERIALIZER_SIZES	posts per list, 100,1000,10000,100000 by default
+	MACC_BENCHMARK_REPEAT	runs per measure, the best time is kept
+	MACC_SERIALIZER_REPORT	file to save the measures to as json
+"""
+
+from __future__ import print_function
+
+import json
+import os
+from collections import OrderedDict
+
+import pytest
+from django.db import transaction
+from django.utils.six import BytesIO
+from rest_framework.parsers import JSONParser
+from rest_framework.relations import RelatedField
+from rest_framework.renderers import JSONRenderer
+
+from factories import create_owners, create_pcsa_posts
+from measures import measure
+from pcsa.models import PcsaPost
+from pcsa.serializers import PcsaPostSerializer
+
+SIZES = [int(size) for size in os.environ.get('MACC_SERIALIZER_SIZES',
+	'100,1000,10000,100000').split(',')]
+
+pytestmark = [
+	pytest.mark.skipif(not os.environ.get('MACC_BENCHMARK'),
+		reason='set MACC_BENCHMARK=1 to run the benchmarks'),
+	pytest.mark.django_db,
+]
+
+
+def get_projection(serializer_class):
+	"""
+	Returns the name, source and conversion of every field of
+	serializer_class, related fields are projected to their key
+	"""
+	projection = []
+	for name, field in serializer_class().fields.items():
+		if field.source == '*' or '.' in field.source:
+			raise ValueError('%s.%s can not be projected from values_list' % (
+				serializer_class.__name__, name))
+		convert = None if isinstance(field, RelatedField) else \
+			field.to_representation
+		projection.append((name, field.source, convert))
+	return projection
+
+
+def project_posts(queryset, serializer_class=PcsaPostSerializer):
+	"""
+	Returns the data serializer_class(queryset, many=True) would
+	give, from values_list() rows instead of model instances
+	"""
+	projection = get_projection(serializer_class)
+	names = [name for name, source, convert in projection]
+	converters = [convert for name, source, convert in projection]
+	rows = queryset.values_list(*[source for name, source, convert
+		in projection])
+	return [OrderedDict(zip(names, [
+		value if value is None or convert is None else convert(value)
+		for convert, value in zip(converters, row)])) for row in rows]
+
+
+def serialize_posts(queryset):
+	# a new queryset for every call, so each one fetches and builds the
+	# posts like project_posts fetches its rows
+	return JSONRenderer().render(
+		PcsaPostSerializer(queryset.all(), many=True).data)
+
+
+def serialize_projection(queryset):
+	return JSONRenderer().render(project_posts(queryset))
+
+
+def deserialize_posts(content):
+	data = JSONParser().parse(BytesIO(content))
+	serializer = PcsaPostSerializer(data=data, many=True)
+	assert serializer.is_valid(), serializer.errors
+	return serializer.validated_data
+
+
+def measure_size(size):
+	"""
+	Returns the measures of every step on a list of size posts
+	"""
+	owner = create_owners(1, prefix='serializer')[0]
+	create_pcsa_posts([owner], size)
+	posts = PcsaPost.objects.filter(owner=owner).order_by('id')
+
+	content, serialize = measure(serialize_posts, (posts,), trace_memory=True)
+	projected, project = measure(serialize_projection, (posts,),
+		trace_memory=True)
+	assert projected == content, \
+		'project_posts and PcsaPostSerializer render different json'
+
+	validated, deserialize = measure(deserialize_posts, (content,),
+		trace_memory=True)
+	assert len(validated) == size
+
+	measures = {'serialize': serialize, 'project': project,
+		'deserialize': deserialize}
+	for result in measures.values():
+		result['posts_per_second'] = size / result['seconds'] \
+			if result['seconds'] else None
+	measures['json_bytes'] = len(content)
+	return measures
+
+
+def test_serializer():
+	results = {}
+	for size in SIZES:
+		with transaction.atomic():
+			results[size] = measure_size(size)
+			transaction.set_rollback(True)
+
+		for step in ('serialize', 'project', 'deserialize'):
+			result = results[size][step]
+			memory = '%10.1fKB' % (result['peak_bytes'] / 1024.0) \
+				if result['peak_bytes'] is not None else '%12s' % '-'
+			print('%-12s %8d posts %12.0f posts/s %s' % (step, size,
+				result['posts_per_second'] or 0, memory))
+
+	if os.environ.get('MACC_SERIALIZER_REPORT'):
+		with open(os.environ['MACC_SERIALIZER_REPORT'], 'w') as report_file:
+			json.dump(results, report_file, indent=2)
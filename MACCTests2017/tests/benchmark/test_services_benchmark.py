@@ -0,0 +1,126 @@
+"""
+Benchmarks of the malaria_web, pcsa and pcsa_GHN services and of
+PcsaPostSerializer on scaled datasets of factories.create_scaled_dataset
+
+Every function is timed and its queries counted at each size of
+MACC_BENCHMARK_SIZES (posts per owner). Owner-scoped listing must run
+the same number of queries at every size, and its time must not grow
+faster than the size.
+
+The benchmarks only run when MACC_BENCHMARK is set::
+
+	$ MACC_BENCHMARK=1 pytest -s tests/benchmark
+
+Other settings
+
+	MACC_BENCHMARK_SIZES	posts per owner, 100,1000,5000 by default
+	MACC_BENCHMARK_REPEAT	calls per measure, the best time is kept
+	MACC_BENCHMARK_REPORT	file to save the measures to as json
+"""
+
+from __future__ import print_function
+
+import json
+import os
+
+import pytest
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from factories import create_revposts, create_scaled_dataset
+from malaria_web import services as malaria_services
+from measures import get_exponent, measure
+from pcsa import views as pcsa_views
+from pcsa.models import PcsaPost
+from pcsa.serializers import PcsaPostSerializer
+from pcsa_GHN import services as ghn_services
+
+SIZES = [int(size) for size in
+	os.environ.get('MACC_BENCHMARK_SIZES', '100,1000,5000').split(',')]
+
+# growth of time against the size over which a function is nonlinear
+NONLINEAR_EXPONENT = 1.3
+# times below this are too noisy to tell the growth from
+MIN_SECONDS = 0.01
+
+# functions whose queries must not grow with the posts of the owner
+OWNER_LISTING = ['get_revposts_of_owner', 'count_posts_by_pcuser',
+	'search_post', 'serialize_owner_posts']
+
+pytestmark = [
+	pytest.mark.skipif(not os.environ.get('MACC_BENCHMARK'),
+		reason='set MACC_BENCHMARK=1 to run the benchmarks'),
+	pytest.mark.django_db,
+]
+
+
+def serialize_owner_posts(owner):
+	posts = PcsaPost.objects.filter(owner=owner)
+	return JSONRenderer().render(PcsaPostSerializer(posts, many=True).data)
+
+
+def measure_services(size):
+	"""
+	Returns the measures of every benchmarked function on a
+	dataset of size posts per owner
+	"""
+	dataset = create_scaled_dataset(size)
+	owner = dataset['owners'][0]
+	post = dataset['posts'][0]
+	# the dataset has one revpost per post, the listed post gets size more
+	create_revposts([post], size)
+	pcsa_post = dataset['pcsa_posts'][0]
+
+	calls = [
+		('get_revposts_of_owner', malaria_services.get_revposts_of_owner,
+			(post.id,)),
+		('malaria_get_post_by_id', malaria_services.get_post_by_id,
+			(post.id,)),
+		('pcsa_get_post_by_id', pcsa_views.get_post_by_id, (pcsa_post.id,)),
+		('count_posts_by_pcuser', ghn_services.count_posts_by_pcuser,
+			(owner.user.username,)),
+		('search_post', ghn_services.search_post, (None, 'Title 1', None)),
+		('serialize_owner_posts', serialize_owner_posts, (owner,)),
+	]
+	measures = {}
+	for name, function, args in calls:
+		measures[name] = measure(function, args)[1]
+
+	# deleting is measured once, a second call would find nothing
+	measures['malaria_delete_post_by_id'] = measure(
+		malaria_services.delete_post_by_id, (dataset['posts'][-1].id,), 1)[1]
+	measures['pcsa_delete_post_by_id'] = measure(
+		pcsa_views.delete_post_by_id, (dataset['pcsa_posts'][-1].id,), 1)[1]
+	return measures
+
+
+def test_services():
+	results = {}
+	for size in SIZES:
+		with transaction.atomic():
+			for name, result in measure_services(size).items():
+				results.setdefault(name, []).append(dict(result, size=size))
+			transaction.set_rollback(True)
+
+	violations = []
+	for name, measures in sorted(results.items()):
+		for result in measures:
+			print('%-28s %8d %10.4fs %6d queries' % (name, result['size'],
+				result['seconds'], result['queries']))
+		if name not in OWNER_LISTING:
+			continue
+		if measures[-1]['queries'] > measures[0]['queries']:
+			violations.append('%s: %d queries at %d posts, %d at %d' % (
+				name, measures[0]['queries'], measures[0]['size'],
+				measures[-1]['queries'], measures[-1]['size']))
+		exponent = get_exponent(measures, 'seconds')
+		if measures[-1]['seconds'] >= MIN_SECONDS and \
+				exponent > NONLINEAR_EXPONENT:
+			violations.append('%s: time grows as size ** %.2f' % (
+				name, exponent))
+
+	if os.environ.get('MACC_BENCHMARK_REPORT'):
+		with open(os.environ['MACC_BENCHMARK_REPORT'], 'w') as report_file:
+			json.dump(results, report_file, indent=2)
+
+	assert not violations, '\n'.join(violations)
@@ -1,12 +1,73 @@
+import os
+
 import pytest
 from infohub.app import TestApp
+from selenium import webdriver
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
 
 from macc.config import wsgi
 
+BROWSERS = ('firefox', 'headless-firefox', 'headless-chrome')
+
+
+def pytest_addoption(parser):
+	parser.addoption('--browser-mode', action='store', choices=BROWSERS,
+		default=os.environ.get('MACC_TEST_BROWSER', 'firefox'),
+		help='browser used by the selenium fixture, also read from '
+		'MACC_TEST_BROWSER')
+	parser.addoption('--window-size', action='store',
+		default=os.environ.get('MACC_TEST_WINDOW_SIZE', '1366x768'),
+		help='fixed browser window size as WIDTHxHEIGHT')
+
+
+def create_driver(browser, window_size):
+	"""
+	Creates a driver for the passed browser with a fixed window size,
+	headless modes run on machines without a display
+	"""
+	width, height = [int(side) for side in window_size.lower().split('x')]
+
+	if browser == 'headless-chrome':
+		options = webdriver.ChromeOptions()
+		options.add_argument('--headless')
+		options.add_argument('--disable-gpu')
+		options.add_argument('--window-size=%d,%d' % (width, height))
+		driver = webdriver.Chrome(chrome_options=options)
+	else:
+		options = FirefoxOptions()
+		if browser == 'headless-firefox':
+			options.add_argument('-headless')
+		driver = webdriver.Firefox(firefox_options=options)
+
+	driver.set_window_size(width, height)
+	return driver
+
+
+@pytest.fixture
+def selenium(request):
+	"""
+	browser picked with --browser-mode, replaces the
+	fixture of pytest-selenium
+	"""
+	driver = create_driver(request.config.getoption('browser_mode'),
+		request.config.getoption('window_size'))
+	yield driver
+	driver.quit()
+
+
+@pytest.fixture
+def wsgi_app():
+	"""
+	the MACC wsgi application, called directly
+	by the load tests
+	"""
+	return wsgi.application
+
+
 @pytest.fixture
-def webapp():
+def webapp(wsgi_app):
 	"""
 	simple test to check that this object
 	is used to test calls to a wsgi application
 	"""
-	return TestApp(wsgi.application)
\ No newline at end of file
+	return TestApp(wsgi_app)
@@ -0,0 +1,101 @@
+"""
+Builds owners and posts of the MACC apps with bulk inserts, one query
+per model instead of one per row, for the unit tests and benchmarks
+"""
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+
+from malaria_web.models import Post, RevPost
+from pcsa.models import PcsaPost
+from pcsa_GHN.models import ghnPost
+from signup.models import Pcuser
+
+
+def bulk_create(model, objects):
+	"""
+	Inserts the objects with a single query and returns them
+	with their primary keys set
+	"""
+	created = model.objects.bulk_create(objects)
+	if objects and created[0].pk is None:
+		# the database did not return the ids, the new rows are the last ones
+		created = list(model.objects.order_by('-pk')[:len(objects)])[::-1]
+	return created
+
+
+def create_pcusers(usernames, passwords=None, emails=None,
+		is_superuser=False):
+	"""
+	Creates a user and its Pcuser for every username, with the
+	password and email at the same index ('password' and '' by
+	default), each distinct password is hashed once
+	"""
+	passwords = passwords or ['password'] * len(usernames)
+	emails = emails or [''] * len(usernames)
+	hashes = dict((password, make_password(password))
+		for password in set(passwords))
+	users = bulk_create(User, [
+		User(username=username, password=hashes[password], email=email,
+			is_staff=is_superuser, is_superuser=is_superuser)
+		for username, password, email in zip(usernames, passwords, emails)])
+	return bulk_create(Pcuser, [Pcuser(user=user) for user in users])
+
+
+def create_owners(count, prefix='owner', password='password'):
+	usernames = ['%s%d' % (prefix, index) for index in range(count)]
+	return create_pcusers(usernames, [password] * count)
+
+
+def create_numbered_posts(model, owners, title='title',
+		description='description'):
+	"""
+	Creates a model row for every owner of owners, the n-th one
+	titled 'Title n' and described 'Description n'
+	"""
+	return bulk_create(model, [
+		model(owner=owner, **{title: 'Title %d' % number,
+			description: 'Description %d' % number})
+		for number, owner in enumerate(owners, 1)])
+
+
+def repeat_owners(owners, per_owner):
+	return [owner for owner in owners for _ in range(per_owner)]
+
+
+def create_malaria_posts(owners, per_owner):
+	return create_numbered_posts(Post, repeat_owners(owners, per_owner),
+		'title_post', 'description_post')
+
+
+def create_revposts(posts, per_post):
+	return bulk_create(RevPost, [
+		RevPost(owner_rev=post.owner,
+			owner_rev_post=post,
+			title_post_rev='Title %d' % index,
+			description_post_rev='Description %d' % index)
+		for post in posts for index in range(per_post)])
+
+
+def create_ghn_posts(owners, per_owner):
+	return create_numbered_posts(ghnPost, repeat_owners(owners, per_owner))
+
+
+def create_pcsa_posts(owners, per_owner):
+	return create_numbered_posts(PcsaPost, repeat_owners(owners, per_owner))
+
+
+def create_scaled_dataset(per_owner, owners=2, revposts_per_post=1):
+	"""
+	Creates owners with per_owner Post, ghnPost and PcsaPost rows
+	each, and revposts_per_post RevPost rows for every Post
+	"""
+	pcusers = create_owners(owners, prefix='scaled')
+	posts = create_malaria_posts(pcusers, per_owner)
+	return {
+		'owners': pcusers,
+		'posts': posts,
+		'revposts': create_revposts(posts, revposts_per_post),
+		'ghn_posts': create_ghn_posts(pcusers, per_owner),
+		'pcsa_posts': create_pcsa_posts(pcusers, per_owner),
+	}
@@ -0,0 +1,213 @@
+"""
+In-process load test of the MACC wsgi application
+
+Requests are picked from a weighted mix and sent straight to the wsgi
+application from a pool of worker threads, with no server or sockets in
+between. Throughput, latency percentiles and a latency histogram are
+printed per request and for the whole run.
+
+The test only runs when MACC_LOAD_TEST is set::
+
+	$ MACC_LOAD_TEST=1 pytest -s tests/load
+
+Other settings
+
+	MACC_LOAD_REQUESTS	number of requests sent, 500 by default
+	MACC_LOAD_WORKERS	number of concurrent requests, 4 by default
+	MACC_LOAD_MIX	weights replacing the ones of MIX, for ex.
+			dashboard=1,pcsa_posts=5
+	MACC_LOAD_SEED	seed of the request order, 0 by default
+	MACC_LOAD_REPORT	file to save the results to as json
+"""
+
+from __future__ import print_function
+
+import bisect
+import json
+import os
+import random
+import sys
+import time
+from multiprocessing.pool import ThreadPool
+from wsgiref.util import setup_testing_defaults
+
+import pytest
+from django.core.management import call_command
+from django.core.urlresolvers import reverse
+
+from measures import percentile
+
+REQUESTS = int(os.environ.get('MACC_LOAD_REQUESTS', 500))
+WORKERS = int(os.environ.get('MACC_LOAD_WORKERS', 4))
+SEED = int(os.environ.get('MACC_LOAD_SEED', 0))
+
+# name, method, path (or url name) and weight of every request of the mix
+MIX = [
+	('dashboard', 'GET', '/', 5),
+	('admin', 'GET', '/admin/', 1),
+	('signup_do', 'GET', '/signup_do/', 2),
+	('login_do', 'GET', '/login_do/', 2),
+	('pcsa_posts', 'GET', 'post-list', 3),
+]
+
+# upper bounds of the histogram buckets, in milliseconds
+BUCKETS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000]
+
+
+def get_mix():
+	"""
+	Returns MIX with the weights of MACC_LOAD_MIX and the url
+	names resolved to paths
+	"""
+	weights = {}
+	for entry in os.environ.get('MACC_LOAD_MIX', '').split(','):
+		if entry.strip():
+			name, weight = entry.split('=')
+			weights[name.strip()] = int(weight)
+
+	mix = []
+	for name, method, path, weight in MIX:
+		if not path.startswith('/'):
+			path = reverse(path)
+		weight = weights.get(name, weight)
+		if weight > 0:
+			mix.append((name, method, path, weight))
+	return mix
+
+
+def schedule(mix, count, seed=SEED):
+	"""
+	Returns count requests of mix picked by weight, in the
+	same order for the same seed
+	"""
+	rng = random.Random(seed)
+	totals = []
+	total = 0
+	for entry in mix:
+		total += entry[3]
+		totals.append(total)
+	return [mix[bisect.bisect(totals, rng.random() * total)]
+		for _ in range(count)]
+
+
+def call_wsgi(application, method, path):
+	"""
+	Calls the wsgi application once and returns the status,
+	the size of the body and the latency in seconds
+	"""
+	environ = {
+		'REQUEST_METHOD': method,
+		'PATH_INFO': path,
+		'SERVER_NAME': 'testserver',
+		'HTTP_HOST': 'testserver',
+		'wsgi.errors': sys.stderr,
+	}
+	setup_testing_defaults(environ)
+	status = []
+
+	def start_response(response_status, headers, exc_info=None):
+		status.append(int(response_status.split()[0]))
+
+	start = time.time()
+	body = application(environ, start_response)
+	try:
+		size = sum(len(chunk) for chunk in body)
+	finally:
+		# sends request_finished, which closes the thread's connection
+		if hasattr(body, 'close'):
+			body.close()
+	return status[0], size, time.time() - start
+
+
+def histogram(latencies):
+	"""
+	Returns the number of latencies in each bucket of BUCKETS
+	and over the last one
+	"""
+	counts = [0] * (len(BUCKETS) + 1)
+	for latency in latencies:
+		counts[bisect.bisect_left(BUCKETS, latency * 1000)] += 1
+	return counts
+
+
+def summarize(results, duration):
+	"""
+	Returns the throughput, percentiles, histogram and statuses
+	of the results, per request name and for all of them
+	"""
+	groups = {'all': results}
+	for result in results:
+		groups.setdefault(result['name'], []).append(result)
+
+	summary = {}
+	for name, group in groups.items():
+		latencies = [result['latency'] for result in group]
+		statuses = {}
+		for result in group:
+			statuses[result['status']] = statuses.get(result['status'], 0) + 1
+		summary[name] = {
+			'requests': len(group),
+			'throughput': len(group) / duration,
+			'p50': percentile(latencies, 50),
+			'p95': percentile(latencies, 95),
+			'p99': percentile(latencies, 99),
+			'max': max(latencies),
+			'histogram': histogram(latencies),
+			'statuses': statuses,
+		}
+	return summary
+
+
+def run_load(application, mix, count=REQUESTS, workers=WORKERS):
+	"""
+	Sends count requests of mix to the application from a pool of
+	workers and returns the results and the duration of the run
+	"""
+	def send(request):
+		name, method, path, weight = request
+		status, size, latency = call_wsgi(application, method, path)
+		return {'name': name, 'path': path, 'status': status,
+			'size': size, 'latency': latency}
+
+	pool = ThreadPool(workers)
+	start = time.time()
+	try:
+		results = pool.map(send, schedule(mix, count))
+	finally:
+		pool.close()
+		pool.join()
+	return results, time.time() - start
+
+
+def report(summary):
+	labels = ['<=%dms' % bucket for bucket in BUCKETS] + \
+		['>%dms' % BUCKETS[-1]]
+	for name in sorted(summary, key=lambda name: (name == 'all', name)):
+		entry = summary[name]
+		print('%-12s %6d requests %8.1f/s p50 %7.1fms p95 %7.1fms '
+			'p99 %7.1fms statuses %s' % (name, entry['requests'],
+			entry['throughput'], entry['p50'] * 1000, entry['p95'] * 1000,
+			entry['p99'] * 1000, entry['statuses']))
+		print('             ' + ' '.join('%s:%d' % (label, count)
+			for label, count in zip(labels, entry['histogram']) if count))
+
+
+@pytest.mark.skipif(not os.environ.get('MACC_LOAD_TEST'),
+	reason='set MACC_LOAD_TEST=1 to run the load test')
+@pytest.mark.django_db(transaction=True)
+def test_load(wsgi_app):
+	# the workers use their own connections, which only see committed data
+	call_command('load_initial_data')
+
+	results, duration = run_load(wsgi_app, get_mix())
+	summary = summarize(results, duration)
+	report(summary)
+
+	if os.environ.get('MACC_LOAD_REPORT'):
+		with open(os.environ['MACC_LOAD_REPORT'], 'w') as report_file:
+			json.dump({'summary': summary, 'results': results},
+				report_file, indent=2)
+
+	errors = [result for result in results if result['status'] >= 500]
+	assert not errors, '%d server errors, first on %s' % (
+		len(errors), errors[0]['path'])
@@ -0,0 +1,77 @@
+"""
+Measuring helpers shared by the benchmark, load and url tests
+
+Django is only imported by measure, so the url checks can use this
+module against a remote server without it.
+"""
+
+import math
+import os
+import time
+
+try:
+	import tracemalloc
+except ImportError:
+	tracemalloc = None
+
+# calls per measure, the best time of them is kept
+REPEAT = int(os.environ.get('MACC_BENCHMARK_REPEAT', 3))
+
+
+def measure(function, args, repeat=REPEAT, trace_memory=False):
+	"""
+	Calls function(*args) repeat times and returns its result with
+	the best time in seconds and the queries of one call, querysets
+	are evaluated. With trace_memory the peak memory allocated by one
+	more untimed call is added when tracemalloc is available (Python 3)
+	"""
+	from django.db import connection
+	from django.db.models.query import QuerySet
+	from django.test.utils import CaptureQueriesContext
+
+	best = None
+	for _ in range(repeat):
+		with CaptureQueriesContext(connection) as context:
+			start = time.time()
+			result = function(*args)
+			if isinstance(result, QuerySet):
+				len(result)
+			duration = time.time() - start
+		best = duration if best is None else min(best, duration)
+	measures = {'seconds': best, 'queries': len(context.captured_queries)}
+
+	if trace_memory:
+		measures['peak_bytes'] = None
+		if tracemalloc is not None:
+			# tracing slows the call down, so it is not timed
+			tracemalloc.start()
+			try:
+				function(*args)
+				measures['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+			finally:
+				tracemalloc.stop()
+	return result, measures
+
+
+def get_exponent(measures, metric):
+	"""
+	Returns the exponent k of metric ~ size ** k between the
+	measures of the smallest and largest size
+	"""
+	first, last = measures[0], measures[-1]
+	if first['size'] == last['size'] or first[metric] <= 0 or \
+			last[metric] <= 0:
+		return 0.0
+	return math.log(float(last[metric]) / first[metric]) / \
+		math.log(float(last['size']) / first['size'])
+
+
+def percentile(values, percent):
+	"""
+	Returns the nearest-rank percentile of values, None without values
+	"""
+	if not values:
+		return None
+	values = sorted(values)
+	rank = max(int(round(percent / 100.0 * len(values))), 1)
+	return values[rank - 1]
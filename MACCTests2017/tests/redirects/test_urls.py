@@ -1,6 +1,12 @@
 """
 Basic tests to check whether the commonly used
-urls return the 200 return code or not
+urls return the expected return code or not
+
+The routes are read from routes.txt, one per line with an optional
+expected status (200 by default). They are fetched concurrently over
+keep-alive connections, and the status, latency and size of every
+response is reported along with the p50/p95 latency. All failing routes
+are reported together.
 
 To use::
 
@@ -9,32 +15,127 @@ To use::
 To specify the server to run against
 
 	$ SERVER_URL=http://example.com make test-test_urls
+
+Other settings
+
+	URL_ROUTES	route file to read instead of routes.txt
+	URL_WORKERS	number of concurrent requests, 8 by default
+	URL_TIMEOUT	seconds before a request fails, 10 by default
+	URL_REPORT	file to save the results to as json
 """
 
+from __future__ import print_function
+
+import json
 import os
 import sys
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+
 import requests
+from requests.adapters import HTTPAdapter
+
+# the shared helpers are in tests/, which is not on the path of the script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from measures import percentile
 
 BASEURL = os.environ.get('SERVER_URL', 'http://web:8000')
+ROUTES = os.environ.get('URL_ROUTES',
+	os.path.join(os.path.dirname(os.path.abspath(__file__)), 'routes.txt'))
+WORKERS = int(os.environ.get('URL_WORKERS', 8))
+TIMEOUT = float(os.environ.get('URL_TIMEOUT', 10))
+
+# one keep-alive session per worker thread
+sessions = threading.local()
+
+
+def read_routes(path):
+	"""
+	Returns the (path, expected status) entries of a route file,
+	skipping blank lines and comments
+	"""
+	routes = []
+	with open(path) as route_file:
+		for line in route_file:
+			line = line.split('#', 1)[0].strip()
+			if not line:
+				continue
+			parts = line.split()
+			status = int(parts[1]) if len(parts) > 1 else 200
+			routes.append((parts[0], status))
+	return routes
 
-def main():
-	# Does the dashboard page work?
-	resp = requests.get(BASEURL)
-	assert resp.status_code == 200
 
-	# Does the admin page work?
-	resp = requests.get(BASEURL + '/admin/')
-	assert resp.status_code == 200
+def get_session():
+	if not hasattr(sessions, 'session'):
+		session = requests.Session()
+		adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+		session.mount('http://', adapter)
+		session.mount('https://', adapter)
+		sessions.session = session
+	return sessions.session
 
-	# Does the signup page work?
-	resp = requests.get(BASEURL + '/signup_do/')
-	assert resp.status_code == 200
 
-	# Does the login page show up?
-	resp = requests.get(BASEURL + '/login_do/')
-	assert resp.status_code == 200
+def check_route(route):
+	"""
+	Fetches a route and returns its result, a request error is
+	recorded as a failure instead of raised
+	"""
+	path, expected = route
+	result = {'path': path, 'expected': expected, 'status': None,
+		'latency': None, 'size': None, 'error': None}
+	start = time.time()
+	try:
+		resp = get_session().get(BASEURL + path, timeout=TIMEOUT)
+		result['latency'] = time.time() - start
+		result['status'] = resp.status_code
+		result['size'] = len(resp.content)
+	except requests.RequestException as error:
+		result['latency'] = time.time() - start
+		result['error'] = str(error)
+	result['ok'] = result['status'] == expected
+	return result
+
+
+def check_routes(routes, workers=WORKERS):
+	pool = ThreadPool(max(min(workers, len(routes)), 1))
+	try:
+		return pool.map(check_route, routes)
+	finally:
+		pool.close()
+		pool.join()
+
+
+def report(results):
+	if not results:
+		print('no routes to check')
+		return []
+	latencies = [result['latency'] for result in results]
+	for result in results:
+		print('%-40s %5s %8.1fms %9s bytes %s' % (result['path'],
+			result['status'], result['latency'] * 1000, result['size'],
+			'ok' if result['ok'] else 'FAILED'))
+	print('%d routes, p50 %.1fms, p95 %.1fms' % (len(results),
+		percentile(latencies, 50) * 1000, percentile(latencies, 95) * 1000))
+
+	failures = [result for result in results if not result['ok']]
+	for result in failures:
+		print('FAILED %s: expected %s, got %s' % (result['path'],
+			result['expected'], result['error'] or result['status']))
+	return failures
+
+
+def main():
+	routes = read_routes(ROUTES)
+	results = check_routes(routes)
+	failures = report(results)
+
+	if os.environ.get('URL_REPORT'):
+		with open(os.environ['URL_REPORT'], 'w') as report_file:
+			json.dump(results, report_file, indent=2)
 
-	return 0
+	return 1 if failures else 0
 
 if __name__ == '__main__':
 	sys.exit(main())
@@ -1,59 +1,27 @@
-from django.contrib.auth.models import User
 from django.test import TestCase
 
+from factories import create_numbered_posts, create_pcusers
 from malaria_web.models import Post, RevPost
 from malaria_web.services import (create_revpost, delete_post_by_id,
                                   get_post_by_id, get_revposts_of_owner)
-from signup.models import Pcuser
 
 
 class MalariaTests(TestCase):
 
-    def setUp(self):
-        """Setup the test database"""
+    @classmethod
+    def setUpTestData(cls):
+        """Setup the test database shared by the tests"""
 
-        self.u1 = User.objects.create_superuser(username='admin',
-                                                password='password',
-                                                email='')
+        cls.o1, cls.o2 = create_pcusers(['admin', 'admin2'],
+                                        ['password', 'password2'],
+                                        is_superuser=True)
+        cls.u1 = cls.o1.user
+        cls.u2 = cls.o2.user
 
-        self.u2 = User.objects.create_superuser(username='admin2',
-                                                password='password2',
-                                                email='')
-
-        self.u1.save()
-        self.u2.save()
-
-        self.o1 = Pcuser(user=self.u1)
-        self.o2 = Pcuser(user=self.u2)
-
-        self.o1.save()
-        self.o2.save()
-
-        self.p1 = Post(owner=self.o1,
-                       title_post="Title 1",
-                       description_post="Description 1")
-
-        self.p2 = Post(owner=self.o2,
-                       title_post="Title 2",
-                       description_post="Description 2")
-
-        self.p3 = Post(owner=self.o1,
-                       title_post="Title 3",
-                       description_post="Description 3")
-
-        self.p4 = Post(owner=self.o2,
-                       title_post="Title 4",
-                       description_post="Description 4")
-
-        self.p5 = Post(owner=self.o1,
-                       title_post="Title 5",
-                       description_post="Description 5")
-
-        self.p1.save()
-        self.p2.save()
-        self.p3.save()
-        self.p4.save()
-        self.p5.save()
+        (cls.p1, cls.p2, cls.p3,
+         cls.p4, cls.p5) = create_numbered_posts(
+            Post, [cls.o1, cls.o2, cls.o1, cls.o2, cls.o1],
+            'title_post', 'description_post')
 
     def test_create_revpost(self):
 
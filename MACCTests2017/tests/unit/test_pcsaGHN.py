@@ -1,6 +1,7 @@
 from django.test import TestCase
 from django.contrib.auth.models import User
 
+from factories import create_numbered_posts, create_pcusers
 from pcsa_GHN.models import ghnPost, Contact
 from pcsa_GHN.services import *
 
@@ -10,52 +11,18 @@ from signup.models import Pcuser
 
 class pcsa_GHNTests(TestCase):
 
-	def setUp(self):
-
-		self.u1 = User.objects.create_superuser(username='admin',
-								password='password',
-								email='random1@gmail.com'
-								)
-		self.u1.save()
-
-		self.u2 = User.objects.create_superuser(username='admin2',
-								password='password',
-								email=''
-								)
-		self.u2.save()
-
-		self.pcuser_1 = Pcuser.objects.create(user=self.u1)
-		self.pcuser_1.save()
-
-		self.pcuser_2 = Pcuser.objects.create(user=self.u2)
-		self.pcuser_2.save()
-
-		self.post_1 = ghnPost(owner=self.pcuser_1,
-					title='Title 1',
-					description='Description 1'
-					)
-		self.post_2 = ghnPost(owner=self.pcuser_2,
-					title='Title 2',
-					description='Description 2'
-					)
-		self.post_3 = ghnPost(owner=self.pcuser_2,
-					title='Title 3',
-					description='Description 3'
-					)
-		self.post_4 = ghnPost(owner=self.pcuser_1,
-					title='Title 4',
-					description='Description 4'
-					)
-		self.post_5 = ghnPost(owner=self.pcuser_1,
-					title='Title 5',
-					description='Description 5'
-					)
-
-		self.post_1.save()
-		self.post_2.save()
-		self.post_3.save()
-		self.post_4.save()
-		self.post_5.save()
+	@classmethod
+	def setUpTestData(cls):
+		cls.pcuser_1, cls.pcuser_2 = create_pcusers(['admin', 'admin2'],
+						emails=['random1@gmail.com', ''],
+						is_superuser=True)
+		cls.u1 = cls.pcuser_1.user
+		cls.u2 = cls.pcuser_2.user
+
+		(cls.post_1, cls.post_2, cls.post_3,
+			cls.post_4, cls.post_5) = create_numbered_posts(ghnPost, [
+				cls.pcuser_1, cls.pcuser_2, cls.pcuser_2,
+				cls.pcuser_1, cls.pcuser_1])
 
 	def test_create_post(self):
 
@@ -1,6 +1,5 @@
 from datetime import datetime
 
-from django.contrib.auth.models import User
 from django.core.urlresolvers import reverse
 from django.test import TestCase
 from django.utils.six import BytesIO
@@ -9,60 +8,29 @@ from rest_framework.parsers import JSONParser
 from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
 
+from factories import create_numbered_posts, create_pcusers
 from pcsa.models import PcsaPost
 from pcsa.serializers import PcsaPostSerializer
 from pcsa.views import delete_post_by_id, get_post_by_id
-from signup.models import Pcuser
 
 
 # Create your tests here.
 
 class PcsaTests(APITestCase):
 
-    def setUp(self):
-        self.user1 = User.objects.create_superuser(username='admin',
-                                                password='password',
-                                                email='')
-
-        self.user2 = User.objects.create_superuser(username='admin2',
-                                                password='password2',
-                                                email='')
-
-        self.user1.save()
-        self.user2.save()
-
-        self.o1 = Pcuser(user=self.user1)
-        self.o2 = Pcuser(user=self.user2)
-
-        self.o1.save()
-        self.o2.save()
-
-        self.post1 = PcsaPost(owner=self.o1,
-                       title="Title 1",
-                       description="Description 1")
+    @classmethod
+    def setUpTestData(cls):
+        cls.o1, cls.o2 = create_pcusers(['admin', 'admin2'],
+                                        ['password', 'password2'],
+                                        is_superuser=True)
+        cls.user1 = cls.o1.user
+        cls.user2 = cls.o2.user
 
-        self.post2 = PcsaPost(owner=self.o2,
-                       title="Title 2",
-                       description="Description 2")
-
-        self.post3 = PcsaPost(owner=self.o1,
-                       title="Title 3",
-                       description="Description 3")
-
-        self.post4 = PcsaPost(owner=self.o2,
-                       title="Title 4",
-                       description="Description 4")
-
-        self.post5 = PcsaPost(owner=self.o1,
-                       title="Title 5",
-                       description="Description 5")
-
-        self.post1.save()
-        self.post2.save()
-        self.post3.save()
-        self.post4.save()
-        self.post5.save()
+        (cls.post1, cls.post2, cls.post3,
+         cls.post4, cls.post5) = create_numbered_posts(
+            PcsaPost, [cls.o1, cls.o2, cls.o1, cls.o2, cls.o1])
 
+    def setUp(self):
         self.data_1 = {'owner': 1,
                        'title': 'Test 1',
                        'description': 'Test 1',
@@ -1,5 +1,6 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
+from pom.driverPool import driver_pool
 from pom.pages.eventsPage import EventsPage
 from pom.pages.authenticationPage import AuthenticationPage
 from pom.locators.eventsPageLocators import *
@@ -15,11 +16,10 @@ from shift.utils import (
     create_shift_with_details
     )
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.support.ui import Select
 
-class FormFields(LiveServerTestCase):
+class FormFields(BaseLiveServerTestCase):
     '''
     Contains Tests for
     - checking if value in forms are saved for event, shift
@@ -27,18 +27,20 @@ class FormFields(LiveServerTestCase):
     - validation of number of volunteers field
     '''
 
+    credentials = {'username': 'admin', 'password': 'admin'}
+
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Firefox()
-        cls.driver.implicitly_wait(5)
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.settings = EventsPage(cls.driver)
         cls.authentication_page = AuthenticationPage(cls.driver)
         super(FormFields, cls).setUpClass()
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         create_admin()
-        self.login_admin()
+
+    def setUp(self):
         self.settings.go_to_events_page()
 
     def tearDown(self):
@@ -46,7 +48,7 @@ class FormFields(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(FormFields, cls).tearDownClass()
 
     def check_event_form_values(self, event):
@@ -69,10 +71,6 @@ class FormFields(LiveServerTestCase):
         self.assertEqual(settings.get_shift_end_time_value(), shift[2])
         self.assertEqual(settings.get_shift_max_volunteers(), shift[3])
 
-    def login_admin(self):
-        self.authentication_page.server_url = self.live_server_url
-        self.authentication_page.login({'username': 'admin', 'password': 'admin'})
-
     def test_null_values_in_create_event(self):
         event = ['', '', '']
         settings = self.settings
@@ -1,7 +1,8 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
 from django.db import IntegrityError
 
+from pom.driverPool import driver_pool
 from pom.locators.administratorReportPageLocators import *
 from pom.pages.administratorReportPage import AdministratorReportPage
 from pom.pages.authenticationPage import AuthenticationPage
@@ -17,27 +18,28 @@ from shift.utils import (
     register_volunteer_for_shift_utility
     )
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
 
-class Report(LiveServerTestCase):
+class Report(BaseLiveServerTestCase):
     '''
     '''
 
+    credentials = {'username': 'admin', 'password': 'admin'}
+
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Firefox()
-        cls.driver.implicitly_wait(5)
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.authentication_page = AuthenticationPage(cls.driver)
         cls.report_page = AdministratorReportPage(cls.driver)
         cls.elements = AdministratorReportPageLocators()
         super(Report, cls).setUpClass()
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         create_admin()
-        self.login_admin()
+
+    def setUp(self):
         self.report_page.go_to_admin_report()
 
     def tearDown(self):
@@ -45,13 +47,9 @@ class Report(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(Report, cls).tearDownClass()
 
-    def login_admin(self):
-        self.authentication_page.server_url = self.live_server_url
-        self.authentication_page.login({ 'username' : 'admin', 'password' : 'admin'})
-
     def verify_shift_details(self, total_shifts, hours):
         total_no_of_shifts = self.report_page.get_shift_summary().split(' ')[10].strip('\nTotal')
         total_no_of_hours = self.report_page.get_shift_summary().split(' ')[-1].strip('\n')
@@ -106,6 +104,29 @@ class Report(LiveServerTestCase):
         report_page.fill_report_form(['','','','',''])
         self.assertEqual(report_page.get_alert_box_text(),report_page.no_results_message)
 
+    def test_logged_shift_details_are_reported(self):
+        volunteer = create_volunteer()
+        volunteer.organization = create_organization_with_details('organization-one')
+        volunteer.save()
+
+        event = ['Hackathon', '2017-08-21', '2017-09-28']
+        created_event = create_event_with_details(event)
+        job = ['Developer', '2017-08-21', '2017-08-30', '',created_event]
+        created_job = create_job_with_details(job)
+        shift = ['2017-08-21', '09:00', '15:00', '10', created_job]
+        created_shift = create_shift_with_details(shift)
+        log_hours_with_details(volunteer, created_shift, "09:00", "12:00")
+
+        report_page = self.report_page
+        report_page.fill_report_form(['','','','',''])
+
+        # the cells of NAME, DATE, START_TIME, END_TIME and HOURS
+        rows = report_page.get_report_rows()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual([rows[0][0]] + rows[0][5:9],
+                         [created_event.name, 'Aug. 21, 2017', '9 a.m.',
+                          '12 p.m.', '3.0'])
+
     def test_only_logged_shifts_are_reported(self):
         # register dataset
         org = create_organization_with_details('organization-one')
@@ -1,5 +1,6 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
+from pom.driverPool import driver_pool
 from pom.pages.eventsPage import EventsPage
 from pom.pages.authenticationPage import AuthenticationPage
 from pom.locators.eventsPageLocators import *
@@ -19,11 +20,10 @@ from shift.utils import (
     create_organization
     )
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
 
-class Settings(LiveServerTestCase):
+class Settings(BaseLiveServerTestCase):
     '''
     Settings Class contains UI testcases for `Events` tab in
     Administrator profile. This view consists of Events, Jobs, Shifts,
@@ -67,19 +67,21 @@ class Settings(LiveServerTestCase):
     at several places has been updated to 2017
     '''
 
+    credentials = {'username': 'admin', 'password': 'admin'}
+
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Firefox()
-        cls.driver.implicitly_wait(5)
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.settings = EventsPage(cls.driver)
         cls.authentication_page = AuthenticationPage(cls.driver)
         cls.elements = EventsPageLocators()
         super(Settings, cls).setUpClass()
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         create_admin()
-        self.login_admin()
+
+    def setUp(self):
         self.settings.go_to_events_page()
 
     def tearDown(self):
@@ -87,13 +89,9 @@ class Settings(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(Settings, cls).tearDownClass()
 
-    def login_admin(self):
-        self.authentication_page.server_url = self.live_server_url
-        self.authentication_page.login({'username' : 'admin', 'password' : 'admin'})
-
     def delete_event_from_list(self):
         settings = self.settings
         self.assertEqual(settings.element_by_xpath(
@@ -1,19 +1,29 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+import unittest
+
+from pom.baseTestCase import BaseLiveServerTestCase
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
+from pom.driverPool import driver_pool
 from pom.pages.authenticationPage import AuthenticationPage
 from pom.pageUrls import PageUrls
 
+try:
+    from pom.httpDriver import HttpDriver
+except ImportError:
+    # requests and lxml are only needed by the http driver
+    HttpDriver = None
+
 from shift.utils import (
     create_admin,
-    create_volunteer
+    create_volunteer,
+    use_real_password_hasher
     )
 
 import re
 
-class TestAccessControl(LiveServerTestCase):
+@use_real_password_hasher
+class TestAccessControl(BaseLiveServerTestCase):
     '''
     TestAccessControl class contains the functional tests to check Admin and
     Volunteer can access '/home' view of VMS. Following tests are included:
@@ -26,9 +36,10 @@ class TestAccessControl(LiveServerTestCase):
     '''
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Firefox()
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.authentication_page = AuthenticationPage(cls.driver)
+        # these tests exercise the login form itself
+        cls.authentication_page.login_mode = 'form'
         super(TestAccessControl, cls).setUpClass()
 
     def setUp(self):
@@ -40,7 +51,7 @@ class TestAccessControl(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(TestAccessControl, cls).tearDownClass()
 
     def test_correct_admin_credentials(self):
@@ -105,3 +116,37 @@ class TestAccessControl(LiveServerTestCase):
                 authentication_page.url)
 
         self.assertNotEqual(authentication_page.get_incorrect_login_message(), None)
+
+
+@unittest.skipIf(HttpDriver is None, 'the http driver needs requests and lxml')
+class TestHttpDriverSessionLogin(BaseLiveServerTestCase):
+    '''
+    Checks that the session cookie set by the default login reaches the
+    live server when the tests run with VMS_TEST_BROWSER=http.
+    '''
+    @classmethod
+    def setUpClass(cls):
+        cls.driver = HttpDriver()
+        cls.authentication_page = AuthenticationPage(cls.driver)
+        cls.authentication_page.login_mode = 'session'
+        super(TestHttpDriverSessionLogin, cls).setUpClass()
+
+    def setUp(self):
+        create_admin()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.driver.quit()
+        super(TestHttpDriverSessionLogin, cls).tearDownClass()
+
+    def test_session_login_opens_page_needing_login(self):
+        authentication_page = self.authentication_page
+        authentication_page.server_url = self.live_server_url
+        authentication_page.login({ 'username' : 'admin', 'password' : 'admin'})
+
+        settings_url = self.live_server_url + PageUrls.admin_settings_page
+        self.driver.get(settings_url)
+        # an anonymous request is redirected to the login page
+        self.assertEqual(self.driver.current_url, settings_url)
+        self.assertIsNotNone(self.driver.find_element_by_link_text(
+            authentication_page.home.LOGOUT_TEXT))
@@ -4,13 +4,17 @@ from datetime import date
 
 from shift.models import VolunteerShift
 
+from shift.benchmark import QueryBudget, assert_constant_queries
 from shift.services import register
 from shift.utils import (
         create_event_with_details,
-        create_job_with_details,
+        create_events_in_bulk,
+        create_jobs_in_bulk,
+        create_shifts_in_bulk,
         create_volunteer_with_details,
-        create_shift_with_details,
-        clear_objects
+        begin_module_transaction,
+        clear_objects,
+        seed_dataset
         )
 from event.services import (
         event_not_empty,
@@ -24,26 +28,26 @@ from event.services import (
         remove_empty_events_for_volunteer    
         )
 
-def setUpModule():
+# Most queries each call of these services may run
+event_not_empty = QueryBudget(1)(event_not_empty)
+get_event_by_id = QueryBudget(1)(get_event_by_id)
+get_events_ordered_by_name = QueryBudget(1)(get_events_ordered_by_name)
+get_events_by_date = QueryBudget(1)(get_events_by_date)
+get_event_by_shift_id = QueryBudget(3)(get_event_by_shift_id)
+
+def build_dataset():
     """
     Creates events, jobs and shifts which can be reused by multiple test classes
     """
 
-    global e1,e2,e3,e4,e5
-    global j1,j2,j3,j4,j5
-    global s1,s2,s3,s4
-
     event_1 = ["Open Source Event","2012-10-22","2012-10-23"]
     event_2 = ["Python Event","2013-11-12","2013-11-13"]
     event_3 = ["Django Event","2015-07-02","2015-07-03"]
     event_4 = ["Systers Event","2015-07-25","2015-08-08"]
     event_5 = ["Anita Borg Event","2015-07-07","2015-07-08"]
 
-    e1 = create_event_with_details(event_1)
-    e2 = create_event_with_details(event_2)
-    e3 = create_event_with_details(event_3)
-    e4 = create_event_with_details(event_4)
-    e5 = create_event_with_details(event_5)
+    e1, e2, e3, e4, e5 = create_events_in_bulk(
+        [event_1, event_2, event_3, event_4, event_5])
 
     job_1 = ["Software Developer","2012-10-22","2012-10-23","A software job",e1]
     job_2 = ["Systems Administrator","2013-11-12","2013-11-13","A systems administrator job",e2]
@@ -51,11 +55,8 @@ def setUpModule():
     job_4 = ["Instructor","2012-10-22","2012-10-23","",e4]
     job_5 = ["Instructor","2012-10-22","2012-10-23","",e3]
 
-    j1 = create_job_with_details(job_1)
-    j2 = create_job_with_details(job_2)
-    j3 = create_job_with_details(job_3)
-    j4 = create_job_with_details(job_4)
-    j5 = create_job_with_details(job_5)
+    j1, j2, j3, j4, j5 = create_jobs_in_bulk(
+        [job_1, job_2, job_3, job_4, job_5])
 
     # shifts with limited, plenty and no slots
     shift_1 = ["2012-10-23","9:00","15:00",1,j1]
@@ -63,10 +64,24 @@ def setUpModule():
     shift_3 = ["2013-11-12","12:00","18:00",4,j2]
     shift_4 = ["2013-10-23","10:00","18:00",1,j4]
 
-    s1 = create_shift_with_details(shift_1)
-    s2 = create_shift_with_details(shift_2)
-    s3 = create_shift_with_details(shift_3)
-    s4 = create_shift_with_details(shift_4)
+    s1, s2, s3, s4 = create_shifts_in_bulk(
+        [shift_1, shift_2, shift_3, shift_4])
+    return [e1, e2, e3, e4, e5, j1, j2, j3, j4, j5, s1, s2, s3, s4]
+
+def setUpModule():
+    """
+    Restores the dataset of build_dataset from its snapshot, building it
+    on the first run
+    """
+
+    begin_module_transaction()
+
+    global e1,e2,e3,e4,e5
+    global j1,j2,j3,j4,j5
+    global s1,s2,s3,s4
+
+    (e1, e2, e3, e4, e5, j1, j2, j3, j4, j5,
+     s1, s2, s3, s4) = seed_dataset('event_services', build_dataset)
 
 def tearDownModule():
     # Destroys all objects created
@@ -145,6 +160,17 @@ class EventTests(unittest.TestCase):
         self.assertEqual(event_list[3], self.e2)
         self.assertEqual(event_list[4], self.e4)
 
+    def test_get_events_ordered_by_name_queries(self):
+        """ Test queries of get_events_ordered_by_name() do not grow """
+
+        def build_args(size):
+            create_events_in_bulk(
+                [["Event %d-%d" % (size, index), "2016-01-01", "2016-01-02"]
+                 for index in range(size)])
+            return ()
+
+        assert_constant_queries(get_events_ordered_by_name, build_args)
+
 class EventWithJobTests(unittest.TestCase):
     '''
     Contains tests which require jobs and shifts
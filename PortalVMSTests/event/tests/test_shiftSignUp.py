@@ -1,12 +1,12 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
 from job.models import Job
 from shift.models import VolunteerShift
 
+from pom.driverPool import driver_pool
 from pom.pages.eventSignUpPage import EventSignUpPage
 from pom.pages.authenticationPage import AuthenticationPage
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
 from shift.utils import (
@@ -19,14 +19,12 @@ from shift.utils import (
     register_volunteer_for_shift_utility
     )
 
-class ShiftSignUp(LiveServerTestCase):
+class ShiftSignUp(BaseLiveServerTestCase):
     '''
     '''
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Firefox()
-        cls.driver.implicitly_wait(5)
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.sign_up_page = EventSignUpPage(cls.driver)
         cls.authentication_page = AuthenticationPage(cls.driver)
         super(ShiftSignUp, cls).setUpClass()
@@ -40,7 +38,7 @@ class ShiftSignUp(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(ShiftSignUp, cls).tearDownClass()
 
     def login_volunteer(self):
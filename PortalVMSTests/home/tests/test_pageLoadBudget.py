@@ -0,0 +1,255 @@
+import json
+import os
+import threading
+import time
+import unittest
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+from django.core.signals import request_finished, request_started
+from django.db import connection
+
+from pom.baseTestCase import BaseLiveServerTestCase
+from pom.driverPool import driver_pool
+from pom.pageUrls import PageUrls
+from pom.pages.authenticationPage import AuthenticationPage
+from pom.pages.basePage import BasePage
+from shift.models import VolunteerShift
+
+from shift.utils import (
+    bulk_create_objects,
+    create_admin,
+    create_events_in_bulk,
+    create_jobs_in_bulk,
+    create_shifts_in_bulk,
+    create_volunteer,
+    create_volunteers_in_bulk
+    )
+
+# Number of events, jobs, shifts and volunteers seeded for the page loads
+DATASET_SIZE = int(os.environ.get('VMS_PERF_DATASET_SIZE', 50))
+
+# Default budgets of every route, in milliseconds and queries per page load
+DEFAULT_BUDGET = {
+    'ttfb': float(os.environ.get('VMS_PERF_TTFB_BUDGET', 1000)),
+    'dom_content_loaded': float(os.environ.get('VMS_PERF_DCL_BUDGET', 2000)),
+    'load': float(os.environ.get('VMS_PERF_LOAD_BUDGET', 3000)),
+    'queries': int(os.environ.get('VMS_PERF_QUERY_BUDGET', 50)),
+    }
+
+# Routes with budgets other than the default ones
+BUDGETS = {
+    'administrator_report_page': {'load': 5000},
+    'volunteer_report_page': {'load': 5000},
+    }
+
+# PageUrls entries walked by each role. Entries marked with an id are
+# followed by the id of the logged in volunteer.
+ADMIN_ROUTES = [
+    ('homepage', False),
+    ('shift_list_page', False),
+    ('job_list_page', False),
+    ('event_list_page', False),
+    ('organization_list_page', False),
+    ('administrator_report_page', False),
+    ('admin_registration_page', False),
+    ('admin_settings_page', False),
+    ('volunteer_search_page', False),
+    ('manage_volunteer_shift_page', False),
+    ]
+VOLUNTEER_ROUTES = [
+    ('homepage', False),
+    ('volunteer_report_page', True),
+    ('upcoming_shifts_page', True),
+    ('completed_shifts_page', True),
+    ('shift_sign_up_page', True),
+    ('volunteer_profile_page', True),
+    ]
+ANONYMOUS_ROUTES = [
+    ('authentication_page', False),
+    ('volunteer_registration_page', False),
+    ]
+# logging out would end the session of the walk
+SKIPPED_ROUTES = ['logout_page']
+
+NAVIGATION_TIMING_SCRIPT = """
+    var timing = window.performance.timing;
+    if (!timing.loadEventEnd) {
+        return null;
+    }
+    return {
+        ttfb: timing.responseStart - timing.navigationStart,
+        dom_content_loaded:
+            timing.domContentLoadedEventEnd - timing.navigationStart,
+        load: timing.loadEventEnd - timing.navigationStart
+    };
+"""
+
+
+class QueryCounter(object):
+    """
+    Counts the queries the live server runs for each requested path. The
+    signals are sent from the thread serving the request, so the connection
+    and the path are the ones of that request.
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self.requests = threading.local()
+        self.counted = threading.Condition()
+
+    def start(self, sender, environ=None, **kwargs):
+        self.requests.path = (environ or {}).get('PATH_INFO')
+        connection.force_debug_cursor = True
+        connection.queries_log.clear()
+
+    def finish(self, sender, **kwargs):
+        connection.force_debug_cursor = False
+        path = getattr(self.requests, 'path', None)
+        if path is not None:
+            with self.counted:
+                self.counts[path] = len(connection.queries_log)
+                self.counted.notify_all()
+
+    def clear(self):
+        with self.counted:
+            self.counts.clear()
+
+    def pop(self, path, timeout=10):
+        """
+        Returns and forgets the queries of the last request to path,
+        waiting for the request to finish. Fails when no request to path
+        finished within timeout seconds.
+        """
+        deadline = time.time() + timeout
+        with self.counted:
+            while path not in self.counts:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise AssertionError(
+                        'No request to %s was counted, counted %s' % (
+                            path, sorted(self.counts)))
+                self.counted.wait(remaining)
+            return self.counts.pop(path)
+
+    def connect(self):
+        request_started.connect(self.start)
+        request_finished.connect(self.finish)
+
+    def disconnect(self):
+        request_started.disconnect(self.start)
+        request_finished.disconnect(self.finish)
+
+
+@unittest.skipUnless(os.environ.get('VMS_TEST_PERF'),
+                     'set VMS_TEST_PERF=1 to check the page load budgets')
+class PageLoadBudget(BaseLiveServerTestCase):
+    '''
+    Loads every PageUrls route as admin, as volunteer and logged out
+    against a seeded dataset of VMS_PERF_DATASET_SIZE objects per model.
+    Navigation Timing metrics and the queries of the server are compared
+    to the route's budget, all routes over budget are reported together.
+    Set VMS_PERF_REPORT to a file to save the measures as json.
+    '''
+
+    measures = []
+
+    @classmethod
+    def setUpClass(cls):
+        cls.driver = driver_pool.lease()
+        cls.page = BasePage(cls.driver)
+        cls.authentication_page = AuthenticationPage(cls.driver)
+        cls.query_counter = QueryCounter()
+        cls.query_counter.connect()
+        super(PageLoadBudget, cls).setUpClass()
+
+    def setUp(self):
+        self.admin = create_admin()
+        self.volunteer = create_volunteer()
+        self.seed_dataset()
+        self.authentication_page.server_url = self.live_server_url
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.query_counter.disconnect()
+        driver_pool.release(cls.driver)
+        report = os.environ.get('VMS_PERF_REPORT')
+        if report:
+            with open(report, 'w') as report_file:
+                json.dump(cls.measures, report_file, indent=2)
+        super(PageLoadBudget, cls).tearDownClass()
+
+    def seed_dataset(self):
+        events = create_events_in_bulk([
+            ['event-%d' % index, '2017-01-01', '2017-12-31']
+            for index in range(DATASET_SIZE)])
+        jobs = create_jobs_in_bulk([
+            ['job-%d' % index, '2017-01-01', '2017-12-31', 'job', event]
+            for index, event in enumerate(events)])
+        shifts = create_shifts_in_bulk([
+            ['2017-06-%02d' % (index % 28 + 1), '09:00', '15:00', 5, job]
+            for index, job in enumerate(jobs)])
+        volunteers = create_volunteers_in_bulk([
+            ['perf-volunteer-%d' % index, 'First%d' % index, 'Last%d' % index,
+             'address', 'city', 'state', 'country', '9999999999',
+             'perf%d@volunteer.com' % index]
+            for index in range(DATASET_SIZE)])
+        bulk_create_objects(VolunteerShift, [
+            VolunteerShift(volunteer=volunteer, shift=shift,
+                           start_time='09:00', end_time='12:00')
+            for volunteer, shift in zip(volunteers + [self.volunteer], shifts)])
+
+    def load(self, route, with_id):
+        url = getattr(PageUrls, route)
+        if with_id:
+            url += str(self.volunteer.id)
+        self.query_counter.clear()
+        start = time.time()
+        self.page.get_page(self.live_server_url, url)
+        elapsed = (time.time() - start) * 1000
+        if getattr(self.driver, 'javascript_enabled', True):
+            timing = self.page.wait_for(
+                lambda driver: driver.execute_script(NAVIGATION_TIMING_SCRIPT),
+                settle=False)
+        else:
+            # no browser timings, the fetch is the whole page load
+            timing = {'ttfb': None, 'dom_content_loaded': None,
+                      'load': elapsed}
+        # a redirected route is counted under the path it ended on
+        timing['queries'] = self.query_counter.pop(
+            urlparse(self.driver.current_url).path)
+        return timing
+
+    def check_routes(self, role, routes):
+        violations = []
+        for route, with_id in routes:
+            measure = self.load(route, with_id)
+            budget = dict(DEFAULT_BUDGET, **BUDGETS.get(route, {}))
+            self.measures.append(dict(measure, role=role, route=route))
+            for metric, limit in sorted(budget.items()):
+                if measure[metric] is not None and measure[metric] > limit:
+                    violations.append('%s %s: %s %s over budget %s' % (
+                        role, route, metric, measure[metric], limit))
+        self.assertEqual(violations, [], '\n'.join(violations))
+
+    def test_routes_are_covered(self):
+        routes = set(route for route in vars(PageUrls)
+                     if not route.startswith('_'))
+        walked = set(route for route, with_id in
+                     ADMIN_ROUTES + VOLUNTEER_ROUTES + ANONYMOUS_ROUTES)
+        self.assertEqual(routes - walked - set(SKIPPED_ROUTES), set())
+
+    def test_anonymous_routes(self):
+        self.check_routes('anonymous', ANONYMOUS_ROUTES)
+
+    def test_admin_routes(self):
+        self.authentication_page.login({'username': 'admin', 'password': 'admin'})
+        self.check_routes('admin', ADMIN_ROUTES)
+
+    def test_volunteer_routes(self):
+        self.authentication_page.login(
+            {'username': 'volunteer', 'password': 'volunteer'})
+        self.check_routes('volunteer', VOLUNTEER_ROUTES)
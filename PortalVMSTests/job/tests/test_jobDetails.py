@@ -1,5 +1,6 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
+from pom.driverPool import driver_pool
 from pom.pages.jobDetailsPage import JobDetailsPage
 from pom.pages.authenticationPage import AuthenticationPage
 
@@ -9,10 +10,9 @@ from shift.utils import (
     create_job_with_details
     )
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
-class JobDetails(LiveServerTestCase):
+class JobDetails(BaseLiveServerTestCase):
     '''
     Contains Tests for View Job Details Page
     '''
@@ -20,15 +20,13 @@ class JobDetails(LiveServerTestCase):
         create_admin()
         self.job_list_page = '/job/list/'
 
-        self.driver = webdriver.Firefox()
-        self.driver.implicitly_wait(5)
-        self.driver.maximize_window()
+        self.driver = driver_pool.lease()
         super(JobDetails, self).setUp()
         self.job_details_page = JobDetailsPage(self.driver)
         self.authentication_page = AuthenticationPage(self.driver)
 
     def tearDown(self):
-        self.driver.quit()
+        driver_pool.release(self.driver)
         super(JobDetails, self).tearDown()
 
     def register_job(self):
@@ -3,13 +3,18 @@ import datetime
 from datetime import date
 
 from shift.models import VolunteerShift
+from shift.benchmark import QueryBudget, assert_constant_queries
 from shift.services import register
 from shift.utils import (
         create_event_with_details,
+        create_events_in_bulk,
         create_job_with_details,
+        create_jobs_in_bulk,
         create_volunteer_with_details,
         create_shift_with_details,
-        clear_objects
+        begin_module_transaction,
+        clear_objects,
+        seed_dataset
         )
 
 from job.services import (
@@ -23,25 +28,39 @@ from job.services import (
                             job_not_empty
                             )
 
-def setUpModule():
+# Most queries each call of these services may run
+get_job_by_id = QueryBudget(1)(get_job_by_id)
+get_jobs_by_event_id = QueryBudget(1)(get_jobs_by_event_id)
+get_jobs_ordered_by_title = QueryBudget(1)(get_jobs_ordered_by_title)
+job_not_empty = QueryBudget(1)(job_not_empty)
+
+def build_dataset():
     """
     - Creates objects which can be reused by multiple test classes
     - Creates jobs that can be used later for shift creation
     """
 
-    global e1, e2, j1, j2, j3
     event_1 = ["Software Conference","2012-10-3","2012-11-25"]
     event_2 = ["Django Conference","2012-10-13","2012-11-25"]
-    e1 = create_event_with_details(event_1)
-    e2 = create_event_with_details(event_2)
+    e1, e2 = create_events_in_bulk([event_1, event_2])
 
     job_1 = ["Software Developer","2012-10-22","2012-10-25","A software job",e1]
     job_2 = ["Systems Administrator","2012-10-8","2012-10-16","A systems administrator job",e1]
     job_3 = ["Project Manager","2012-11-2","2012-11-12","A management job",e1]
 
-    j1 = create_job_with_details(job_1)
-    j2 = create_job_with_details(job_2)
-    j3 = create_job_with_details(job_3)
+    j1, j2, j3 = create_jobs_in_bulk([job_1, job_2, job_3])
+    return [e1, e2, j1, j2, j3]
+
+def setUpModule():
+    """
+    Restores the dataset of build_dataset from its snapshot, building it
+    on the first run
+    """
+
+    begin_module_transaction()
+
+    global e1, e2, j1, j2, j3
+    e1, e2, j1, j2, j3 = seed_dataset('job_services', build_dataset)
 
 def tearDownModule():
     # Destroys all objects created
@@ -119,6 +138,17 @@ class JobTests(unittest.TestCase):
         self.assertEqual(job_list[1].name, self.j1.name)
         self.assertEqual(job_list[2].name, self.j2.name)
 
+    def test_get_jobs_ordered_by_title_queries(self):
+        """ Test queries of get_jobs_ordered_by_title() do not grow """
+
+        def build_args(size):
+            create_jobs_in_bulk(
+                [["Job %d-%d" % (size, index), "2012-10-22", "2012-10-25",
+                  "A job", self.e2] for index in range(size)])
+            return ()
+
+        assert_constant_queries(get_jobs_ordered_by_title, build_args)
+
 class DeleteJobTest(unittest.TestCase):
 
     @classmethod
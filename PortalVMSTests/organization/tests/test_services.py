@@ -1,7 +1,15 @@
 import unittest
 from organization.models import Organization
 from organization.services import *
-from shift.utils import clear_objects, create_volunteer_with_details
+from shift.benchmark import QueryBudget, assert_constant_queries
+from shift.utils import (begin_module_transaction, bulk_create_objects,
+                         clear_objects, create_volunteer_with_details)
+
+# Most queries each call of these services may run
+get_organization_by_id = QueryBudget(1)(get_organization_by_id)
+get_organization_by_name = QueryBudget(1)(get_organization_by_name)
+get_organizations_ordered_by_name = QueryBudget(1)(
+    get_organizations_ordered_by_name)
 
 class OrganizationMethodTests(unittest.TestCase):
 
@@ -17,6 +25,7 @@ class OrganizationMethodTests(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
+        begin_module_transaction()
         cls.setup_test_data()
 
     @classmethod
@@ -93,6 +102,16 @@ class OrganizationMethodTests(unittest.TestCase):
         self.assertEqual(organization_list[1], self.o3)
         self.assertEqual(organization_list[2], self.o2)
 
+    def test_get_organizations_ordered_by_name_queries(self):
+
+        def build_args(size):
+            bulk_create_objects(Organization, [
+                Organization(name="Organization %d-%d" % (size, index))
+                for index in range(size)])
+            return ()
+
+        assert_constant_queries(get_organizations_ordered_by_name, build_args)
+
 class DeleteOrganizationTests(unittest.TestCase):
 
     @classmethod
@@ -110,6 +129,7 @@ class DeleteOrganizationTests(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
+        begin_module_transaction()
         cls.setup_test_data()
 
     @classmethod
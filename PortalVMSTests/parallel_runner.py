@@ -0,0 +1,248 @@
+"""
+Runs the VMS test suites sharded across several worker processes.
+
+Every `LiveServerTestCase` class is a shard unit of its own, other tests are
+kept together per module so module level fixtures still see their classes.
+Units are spread over the workers by number of tests. Each worker is a
+separate `manage.py test`-like process with its own live server port range,
+its own test database and a headless browser (see `--browser`). The results
+of all workers are merged into a single report.
+
+Run from the vms folder that contains manage.py:
+
+    python parallel_runner.py                      # all tests, one worker per core
+    python parallel_runner.py -n 4 volunteer shift # only these apps, 4 workers
+    python parallel_runner.py --report report.json
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from collections import OrderedDict
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'vms.settings_test')
+
+from pom.driverFactory import BROWSERS
+
+# every worker gets a block of ports for its live server
+PORTS_PER_WORKER = 10
+
+
+def setup_django():
+    import django
+    django.setup()
+
+
+def iter_tests(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            for inner in iter_tests(test):
+                yield inner
+        else:
+            yield test
+
+
+def collect_units(labels):
+    """
+    Returns an ordered mapping of shard unit label to its number of tests
+    """
+    from django.test import LiveServerTestCase
+    from django.test.runner import DiscoverRunner
+
+    units = OrderedDict()
+    for test in iter_tests(DiscoverRunner().build_suite(labels)):
+        test_class = test.__class__
+        if issubclass(test_class, LiveServerTestCase):
+            label = '%s.%s' % (test_class.__module__, test_class.__name__)
+        else:
+            label = test_class.__module__
+        units[label] = units.get(label, 0) + 1
+    return units
+
+
+def split_units(units, workers):
+    """
+    Greedily assigns the biggest units first to the least loaded shard
+    """
+    shards = [[] for _ in range(workers)]
+    loads = [0] * workers
+    for label, count in sorted(units.items(), key=lambda item: -item[1]):
+        index = loads.index(min(loads))
+        shards[index].append(label)
+        loads[index] += count
+    return [shard for shard in shards if shard]
+
+
+def isolate_test_databases(index):
+    """
+    Gives every worker its own test database. In-memory sqlite test
+    databases are private to the process already and are left alone.
+    """
+    from django.db import connections
+
+    for connection in connections.all():
+        settings_dict = connection.settings_dict
+        test_settings = settings_dict.setdefault('TEST', {})
+        name = test_settings.get('NAME')
+        if connection.vendor == 'sqlite' and not name:
+            continue
+        name = name or 'test_' + settings_dict['NAME']
+        test_settings['NAME'] = '%s_shard%d' % (name, index)
+
+
+def run_worker(index, port, labels, result_file, verbosity):
+    os.environ['DJANGO_LIVE_TEST_SERVER_ADDRESS'] = 'localhost:%d-%d' % (
+        port, port + PORTS_PER_WORKER - 1)
+    if os.environ.get('VMS_TEST_PROFILE'):
+        # one page object profile per worker
+        root, extension = os.path.splitext(os.environ['VMS_TEST_PROFILE'])
+        os.environ['VMS_TEST_PROFILE'] = '%s_shard%d%s' % (
+            root, index, extension)
+    setup_django()
+    isolate_test_databases(index)
+
+    from django.test.runner import DiscoverRunner
+
+    runner = DiscoverRunner(verbosity=0, interactive=False)
+    start = time.time()
+    runner.setup_test_environment()
+    old_config = runner.setup_databases()
+    try:
+        suite = runner.build_suite(labels)
+        result = unittest.TextTestRunner(
+            stream=sys.stderr, verbosity=verbosity).run(suite)
+    finally:
+        runner.teardown_databases(old_config)
+        runner.teardown_test_environment()
+
+    report = {
+        'shard': index,
+        'labels': labels,
+        'tests_run': result.testsRun,
+        'failures': [[str(test), trace] for test, trace in result.failures],
+        'errors': [[str(test), trace] for test, trace in result.errors],
+        'skipped': len(result.skipped),
+        'duration': time.time() - start,
+        }
+    with open(result_file, 'w') as report_file:
+        json.dump(report, report_file)
+    return 0 if result.wasSuccessful() else 1
+
+
+def run_shards(shards, base_port, verbosity, browser):
+    """
+    Starts one worker process per shard and waits for all of them
+    """
+    environ = dict(os.environ, VMS_TEST_BROWSER=browser)
+    workdir = tempfile.mkdtemp(prefix='vms_shards_')
+    processes = []
+    for index, labels in enumerate(shards):
+        result_file = os.path.join(workdir, 'shard%d.json' % index)
+        log_file = open(os.path.join(workdir, 'shard%d.log' % index), 'w')
+        command = [sys.executable, os.path.abspath(__file__),
+                   '--worker', str(index),
+                   '--base-port', str(base_port + index * PORTS_PER_WORKER),
+                   '--result-file', result_file,
+                   '--verbosity', str(verbosity)] + labels
+        process = subprocess.Popen(command, stdout=log_file, env=environ,
+                                   stderr=subprocess.STDOUT)
+        processes.append((index, labels, process, result_file, log_file))
+
+    reports = []
+    for index, labels, process, result_file, log_file in processes:
+        process.wait()
+        log_file.close()
+        if os.path.exists(result_file):
+            with open(result_file) as report_file:
+                report = json.load(report_file)
+        else:
+            # the worker died before reporting, surface its log instead
+            with open(log_file.name) as log:
+                report = {'shard': index, 'labels': labels, 'tests_run': 0,
+                          'failures': [], 'skipped': 0, 'duration': 0.0,
+                          'errors': [['shard %d' % index, log.read()]]}
+        report['log'] = log_file.name
+        reports.append(report)
+    return reports
+
+
+def merge_reports(reports, wall_clock):
+    merged = {
+        'shards': reports,
+        'tests_run': sum(report['tests_run'] for report in reports),
+        'failures': [failure for report in reports
+                     for failure in report['failures']],
+        'errors': [error for report in reports for error in report['errors']],
+        'skipped': sum(report['skipped'] for report in reports),
+        'wall_clock': wall_clock,
+        }
+    merged['successful'] = not (merged['failures'] or merged['errors'])
+    return merged
+
+
+def print_report(merged):
+    for kind in ('errors', 'failures'):
+        for test, trace in merged[kind]:
+            print('=' * 70)
+            print('%s: %s' % (kind[:-1].upper(), test))
+            print('-' * 70)
+            print(trace)
+
+    print('-' * 70)
+    for report in merged['shards']:
+        print('shard %d: %d tests in %.1fs (%s)' % (
+            report['shard'], report['tests_run'], report['duration'],
+            report['log']))
+    print('Ran %d tests in %.1fs on %d workers' % (
+        merged['tests_run'], merged['wall_clock'], len(merged['shards'])))
+    if merged['successful']:
+        print('OK' + (' (skipped=%d)' % merged['skipped']
+                      if merged['skipped'] else ''))
+    else:
+        print('FAILED (failures=%d, errors=%d)' % (
+            len(merged['failures']), len(merged['errors'])))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('labels', nargs='*',
+                        help='test labels as accepted by manage.py test')
+    parser.add_argument('-n', '--workers', type=int,
+                        default=multiprocessing.cpu_count())
+    parser.add_argument('--base-port', type=int, default=8081)
+    parser.add_argument('--browser', choices=BROWSERS,
+                        default='headless-firefox',
+                        help='browser the workers run the functional tests in')
+    parser.add_argument('--report', help='write the merged report as json')
+    parser.add_argument('--verbosity', type=int, default=1)
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--result-file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        return run_worker(args.worker, args.base_port, args.labels,
+                          args.result_file, args.verbosity)
+
+    setup_django()
+    start = time.time()
+    shards = split_units(collect_units(args.labels), max(args.workers, 1))
+    reports = run_shards(shards, args.base_port, args.verbosity, args.browser)
+    merged = merge_reports(reports, time.time() - start)
+    print_report(merged)
+    if args.report:
+        with open(args.report, 'w') as report_file:
+            json.dump(merged, report_file, indent=2)
+    return 0 if merged['successful'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
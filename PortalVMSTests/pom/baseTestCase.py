@@ -0,0 +1,208 @@
+import os
+
+from django.apps import apps
+from django.contrib.staticfiles.testing import LiveServerTestCase
+from django.core import serializers, signals
+from django.core.management.color import no_style
+from django.db import (close_old_connections, connection, connections,
+                       transaction)
+
+from pom.liveServer import PooledLiveServerThread, SERVER_WORKERS
+from pom.pageProfiler import profiler
+from pom.staticAssets import CachedStaticFilesHandler
+
+
+class BaseLiveServerTestCase(LiveServerTestCase):
+    """
+    Base class of the functional test classes.
+
+    Isolation of the data created by each test is picked with the
+    VMS_TEST_ISOLATION environment variable or the `isolation` attribute:
+
+    - 'flush' (default) is Django's behaviour, every table is truncated
+      after each test
+    - 'transaction' shares the database connections of the test thread with
+      the live server thread and runs each test inside transactions that are
+      rolled back afterwards, so the cleanup cost does not grow with the
+      schema. Needs Django 1.11 or later, older versions fall back to
+      'flush'. The connection is shared between both threads, so tests must
+      not query the database while a page is still loading.
+
+    Rows shared by all tests of a class, like the admin user, are created
+    once in `setUpTestData`. With `credentials` set, the browser is logged
+    in once as that user through `authentication_page` and stays logged in.
+    Both are kept across the tests of the class: inside a transaction of
+    the class with 'transaction' isolation, restored after every flush
+    otherwise.
+
+    The live server serves one request at a time unless `server_workers`
+    (VMS_TEST_SERVER_WORKERS) is over 1, then requests are served by a
+    pool of that many threads, see pom/liveServer.py.
+    """
+
+    isolation = os.environ.get('VMS_TEST_ISOLATION', 'flush')
+
+    # username and password the browser stays logged in with
+    credentials = None
+
+    # serves static assets from memory, see pom/staticAssets.py
+    static_handler = CachedStaticFilesHandler
+
+    # threads serving the requests of the live server, see pom/liveServer.py
+    server_thread_class = PooledLiveServerThread
+    server_workers = SERVER_WORKERS
+
+    @classmethod
+    def uses_transactions(cls):
+        return cls.isolation == 'transaction' and \
+            hasattr(LiveServerTestCase, '_create_server_thread')
+
+    @classmethod
+    def setUpClass(cls):
+        if cls.uses_transactions():
+            # the server thread must not close the connection it shares with
+            # the test in the middle of the test's transaction
+            signals.request_started.disconnect(close_old_connections)
+            signals.request_finished.disconnect(close_old_connections)
+        super(BaseLiveServerTestCase, cls).setUpClass()
+
+        cls.class_atomics = []
+        try:
+            if cls.uses_transactions():
+                for db in connections.all():
+                    atomic = transaction.atomic(using=db.alias)
+                    atomic.__enter__()
+                    cls.class_atomics.append(atomic)
+                cls.setUpClassFixtures()
+            else:
+                cls.setUpFlushedClassFixtures()
+        except Exception:
+            # tearDownClass is not called when setUpClass fails
+            BaseLiveServerTestCase.tearDownClass.__func__(cls)
+            raise
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Creates the rows shared by all tests of the class
+        """
+
+    @classmethod
+    def setUpClassFixtures(cls):
+        cls.setUpTestData()
+        if cls.credentials:
+            cls.authentication_page.server_url = cls.live_server_url
+            cls.authentication_page.login(cls.credentials)
+
+    @classmethod
+    def has_class_fixtures(cls):
+        return bool(cls.credentials) or cls.setUpTestData.__func__ is not \
+            BaseLiveServerTestCase.setUpTestData.__func__
+
+    @classmethod
+    def setUpFlushedClassFixtures(cls):
+        cls.class_models = []
+        cls.class_rows = []
+        cls.flushed = False
+        if not cls.has_class_fixtures():
+            return
+        # the tables of the models empty before the fixtures only hold rows
+        # of the fixtures afterwards, they are kept to be restored
+        models = [model for model in apps.get_models()
+                  if model._meta.managed and not model._meta.proxy]
+        empty_models = [model for model in models
+                        if not model.objects.exists()]
+        cls.setUpClassFixtures()
+        cls.class_models = [model for model in empty_models
+                            if model.objects.exists()]
+        cls.class_rows = serializers.serialize('python', [
+            row for model in cls.class_models
+            for row in model.objects.order_by('pk')])
+
+    @classmethod
+    def restore_class_rows(cls):
+        """
+        Inserts the rows of the class fixtures back after a flush, with
+        their pks, as loaddata does
+        """
+        with transaction.atomic():
+            with connection.constraint_checks_disabled():
+                for row in serializers.deserialize('python', cls.class_rows):
+                    row.save()
+            with connection.cursor() as cursor:
+                for sql in connection.ops.sequence_reset_sql(
+                        no_style(), cls.class_models):
+                    cursor.execute(sql)
+
+    @classmethod
+    def tearDownClassFixtures(cls):
+        for atomic in reversed(cls.class_atomics):
+            transaction.set_rollback(True, using=atomic.using)
+            atomic.__exit__(None, None, None)
+        cls.class_atomics = []
+        if getattr(cls, 'class_rows', None) and not cls.flushed:
+            # no test ran to flush the rows of the class fixtures
+            with transaction.atomic():
+                for model in reversed(cls.class_models):
+                    model._base_manager.all().delete()
+        cls.class_rows = []
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tearDownClassFixtures()
+        super(BaseLiveServerTestCase, cls).tearDownClass()
+        if cls.uses_transactions():
+            signals.request_started.connect(close_old_connections)
+            signals.request_finished.connect(close_old_connections)
+
+    @classmethod
+    def _create_server_thread(cls, *args):
+        # the connections to share with the server thread are always the
+        # last argument, whatever the Django version
+        if cls.uses_transactions():
+            shared = {}
+            for db in connections.all():
+                if hasattr(db, 'inc_thread_sharing'):
+                    db.inc_thread_sharing()
+                else:
+                    db.allow_thread_sharing = True
+                shared[db.alias] = db
+            args = args[:-1] + (shared,)
+        thread = super(BaseLiveServerTestCase, cls)._create_server_thread(*args)
+        thread.workers = cls.server_workers
+        return thread
+
+    def run(self, result=None):
+        # page object calls and driver commands are profiled per test
+        profiler.test = self.id()
+        try:
+            return super(BaseLiveServerTestCase, self).run(result)
+        finally:
+            profiler.test = None
+
+    def _should_reload_connections(self):
+        # closing the connections after a test would end the transaction of
+        # the class fixtures
+        if self.uses_transactions():
+            return False
+        return super(BaseLiveServerTestCase, self)._should_reload_connections()
+
+    def _fixture_setup(self):
+        if not self.uses_transactions():
+            super(BaseLiveServerTestCase, self)._fixture_setup()
+            if self.flushed and self.class_rows:
+                self.restore_class_rows()
+            return
+        self.atomics = []
+        for db in connections.all():
+            atomic = transaction.atomic(using=db.alias)
+            atomic.__enter__()
+            self.atomics.append(atomic)
+
+    def _fixture_teardown(self):
+        if not self.uses_transactions():
+            type(self).flushed = True
+            return super(BaseLiveServerTestCase, self)._fixture_teardown()
+        for atomic in reversed(self.atomics):
+            transaction.set_rollback(True, using=atomic.using)
+            atomic.__exit__(None, None, None)
@@ -0,0 +1,79 @@
+import os
+
+from selenium import webdriver
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+from pom.staticAssets import (get_blocked_hosts, get_blocked_kinds,
+                              get_proxy_script)
+
+# Browser used by the functional tests, one of BROWSERS. Picked from the
+# VMS_TEST_BROWSER environment variable, parallel_runner.py also takes it as
+# the --browser option.
+BROWSERS = ('firefox', 'headless-firefox', 'headless-chrome', 'http')
+DEFAULT_BROWSER = 'firefox'
+DEFAULT_WINDOW_SIZE = '1366x768'
+
+
+def get_browser():
+    browser = os.environ.get('VMS_TEST_BROWSER', DEFAULT_BROWSER)
+    if browser not in BROWSERS:
+        raise ValueError('VMS_TEST_BROWSER must be one of %s, not %r'
+                         % (', '.join(BROWSERS), browser))
+    return browser
+
+
+def get_window_size():
+    """
+    Returns (width, height) from VMS_TEST_WINDOW_SIZE, for ex. '1366x768'
+    """
+    size = os.environ.get('VMS_TEST_WINDOW_SIZE', DEFAULT_WINDOW_SIZE)
+    width, height = size.lower().split('x')
+    return int(width), int(height)
+
+
+def create_driver(browser=None):
+    """
+    Creates a driver for the passed or configured browser with a fixed
+    window size, so results do not depend on the display of the machine
+    """
+    browser = browser or get_browser()
+    width, height = get_window_size()
+
+    if browser == 'http':
+        # imported here so requests and lxml are only needed for this mode
+        from pom.httpDriver import HttpDriver
+        return HttpDriver()
+
+    # hosts of blocked assets are never reached, blocked fonts never loaded
+    blocked_hosts = get_blocked_hosts()
+    block_fonts = 'fonts' in get_blocked_kinds()
+
+    if browser == 'headless-chrome':
+        options = webdriver.ChromeOptions()
+        options.add_argument('--headless')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--window-size=%d,%d' % (width, height))
+        if blocked_hosts:
+            options.add_argument('--host-resolver-rules=%s' % ', '.join(
+                'MAP %s ~NOTFOUND' % host for host in blocked_hosts))
+        if block_fonts:
+            options.add_argument('--disable-remote-fonts')
+        driver = webdriver.Chrome(chrome_options=options)
+    else:
+        options = FirefoxOptions()
+        if browser == 'headless-firefox':
+            options.add_argument('-headless')
+        # the Firefox options of selenium 3.4 take no preferences
+        profile = webdriver.FirefoxProfile()
+        if blocked_hosts:
+            profile.set_preference('network.proxy.type', 2)
+            profile.set_preference(
+                'network.proxy.autoconfig_url',
+                'data:text/plain,' + get_proxy_script(blocked_hosts))
+        if block_fonts:
+            profile.set_preference('gfx.downloadable_fonts.enabled', False)
+        driver = webdriver.Firefox(firefox_profile=profile,
+                                   firefox_options=options)
+
+    driver.set_window_size(width, height)
+    return driver
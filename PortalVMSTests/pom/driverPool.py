@@ -0,0 +1,104 @@
+import atexit
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from pom.driverFactory import create_driver
+from pom.pageProfiler import profiler
+
+
+class DriverPool(object):
+    """
+    Process-wide pool of warm browsers shared by the functional test classes.
+
+    - `lease` hands out an idle browser or boots a new one from
+      `pom.driverFactory` if none is idle
+    - `release` resets the browser (cookies, storage, about:blank) and puts
+      it back in the pool instead of quitting it
+    - Every boot and reset is timed and kept in `timings`
+    - All pooled browsers are quit when the process exits
+    """
+
+    blank_page = 'about:blank'
+
+    def __init__(self):
+        self.idle = []
+        self.leased = []
+        self.timings = {'boot': [], 'reset': []}
+        self.lock = threading.Lock()
+
+    def boot(self):
+        start = time.time()
+        driver = create_driver()
+        self.timings['boot'].append(time.time() - start)
+        if profiler.enabled:
+            profiler.instrument_driver(driver)
+        return driver
+
+    def lease(self):
+        with self.lock:
+            driver = self.idle.pop() if self.idle else None
+        if driver is None:
+            driver = self.boot()
+        with self.lock:
+            self.leased.append(driver)
+        return driver
+
+    def release(self, driver):
+        with self.lock:
+            if driver in self.leased:
+                self.leased.remove(driver)
+        try:
+            self.reset(driver)
+        except WebDriverException:
+            # a browser that can not be reset is of no use to the next class
+            self.quit_driver(driver)
+            return
+        with self.lock:
+            self.idle.append(driver)
+
+    def reset(self, driver):
+        start = time.time()
+        driver.delete_all_cookies()
+        if driver.current_url != self.blank_page and \
+                getattr(driver, 'javascript_enabled', True):
+            # storage is only reachable while the page of its origin is open
+            driver.execute_script(
+                'try { window.localStorage.clear(); '
+                'window.sessionStorage.clear(); } catch (e) {}')
+        driver.get(self.blank_page)
+        driver.implicitly_wait(0)
+        self.timings['reset'].append(time.time() - start)
+
+    def quit_driver(self, driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def close_all(self):
+        with self.lock:
+            drivers = self.idle + self.leased
+            self.idle = []
+            self.leased = []
+        for driver in drivers:
+            self.quit_driver(driver)
+
+    def stats(self):
+        """
+        Returns count, total and mean seconds spent on boots and resets
+        """
+        stats = {}
+        for event, durations in self.timings.items():
+            total = sum(durations)
+            stats[event] = {
+                'count': len(durations),
+                'total': total,
+                'mean': total / len(durations) if durations else 0.0
+                }
+        return stats
+
+
+driver_pool = DriverPool()
+atexit.register(driver_pool.close_all)
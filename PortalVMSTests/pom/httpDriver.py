@@ -0,0 +1,249 @@
+try:
+    from urllib.parse import urljoin, urlparse
+except ImportError:
+    from urlparse import urljoin, urlparse
+
+import lxml.html
+import requests
+
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+
+
+class HttpElement(object):
+    """
+    Element of a page fetched by HttpDriver. Implements the subset of
+    selenium's WebElement used by the page objects.
+    """
+
+    def __init__(self, driver, node):
+        self.driver = driver
+        self.node = node
+
+    @property
+    def tag_name(self):
+        return self.node.tag
+
+    @property
+    def text(self):
+        return ' '.join(' '.join(self.node.itertext()).split())
+
+    def get_attribute(self, name):
+        if name == 'value' and self.node.tag == 'textarea':
+            return self.node.text or ''
+        if name == 'value' and self.node.tag == 'select':
+            return self.node.value
+        return self.node.get(name)
+
+    def is_displayed(self):
+        return 'display:none' not in (self.node.get('style') or '').replace(' ', '')
+
+    def is_enabled(self):
+        return self.node.get('disabled') is None
+
+    def is_selected(self):
+        return (self.node.get('selected') is not None or
+                self.node.get('checked') is not None)
+
+    def clear(self):
+        if self.node.tag == 'textarea':
+            self.node.text = ''
+        else:
+            self.node.set('value', '')
+
+    def send_keys(self, *values):
+        value = ''.join(values)
+        if value.endswith('\n'):
+            # selenium presses enter, which follows links and submits forms
+            return self.click() if self.node.tag == 'a' else self.submit()
+        if self.node.tag == 'textarea':
+            self.node.text = (self.node.text or '') + value
+        elif self.node.tag == 'select':
+            for option in self.node.iter('option'):
+                if option.text_content().strip().startswith(value):
+                    self.node.value = option.get('value', option.text_content())
+                    break
+        else:
+            self.node.set('value', (self.node.get('value') or '') + value)
+
+    def click(self):
+        node = self.node
+        if node.tag == 'a' and node.get('href'):
+            self.driver.get(urljoin(self.driver.current_url, node.get('href')))
+        elif node.tag == 'option':
+            node.getparent().value = node.get('value', node.text_content())
+        elif node.tag in ('input', 'button') and \
+                (node.get('type') or 'submit').lower() == 'submit':
+            self.submit(button=node)
+        elif node.tag == 'input' and node.get('type') in ('checkbox', 'radio'):
+            node.checked = not node.checked
+
+    def submit(self, button=None):
+        form = self.node if self.node.tag == 'form' else next(
+            (parent for parent in self.node.iterancestors('form')), None)
+        if form is None:
+            raise WebDriverException('Element is not inside a form')
+        self.driver.submit_form(form, button)
+
+    def find_element(self, by=By.ID, value=None):
+        return self.driver.find_element(by, value, root=self.node)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self.driver.find_elements(by, value, root=self.node)
+
+    def find_elements_by_tag_name(self, name):
+        return self.find_elements(By.TAG_NAME, name)
+
+    def find_element_by_tag_name(self, name):
+        return self.find_element(By.TAG_NAME, name)
+
+    def find_element_by_xpath(self, xpath):
+        return self.find_element(By.XPATH, xpath)
+
+    def find_elements_by_xpath(self, xpath):
+        return self.find_elements(By.XPATH, xpath)
+
+
+class HttpDriver(object):
+    """
+    Lightweight driver that fetches pages over plain HTTP without a browser.
+
+    - Pages are parsed with lxml, elements are found by id, xpath, class
+      name, css selector, link text and tag name
+    - Typing into fields only changes the parsed page, submitting a form
+      sends its fields like a browser would and loads the response
+    - No JavaScript is run, `javascript_enabled` tells page objects to use
+      their non-scripted paths
+    """
+
+    javascript_enabled = False
+    blank_page = 'about:blank'
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.current_url = self.blank_page
+        self.page_source = ''
+        self.document = lxml.html.fromstring('<html></html>')
+
+    def load(self, response):
+        self.current_url = response.url
+        self.page_source = response.text
+        self.document = lxml.html.fromstring(response.content or '<html></html>')
+
+    def get(self, url):
+        if url == self.blank_page:
+            self.current_url = self.blank_page
+            self.page_source = ''
+            self.document = lxml.html.fromstring('<html></html>')
+            return
+        self.load(self.session.get(url))
+
+    def submit_form(self, form, button=None):
+        fields = list(form.form_values())
+        if button is not None and button.get('name'):
+            fields.append((button.get('name'), button.get('value', '')))
+        action = urljoin(self.current_url, form.get('action') or self.current_url)
+        if (form.get('method') or 'get').lower() == 'post':
+            self.load(self.session.post(action, data=fields))
+        else:
+            self.load(self.session.get(action, params=fields))
+
+    @property
+    def title(self):
+        titles = self.document.xpath('//title')
+        return titles[0].text_content().strip() if titles else ''
+
+    def xpath_for(self, by, value):
+        if by == By.ID:
+            return './/*[@id="%s"]' % value
+        if by == By.NAME:
+            return './/*[@name="%s"]' % value
+        if by == By.CLASS_NAME:
+            return ('.//*[contains(concat(" ", normalize-space(@class), " "), '
+                    '" %s ")]' % value)
+        if by == By.LINK_TEXT:
+            return './/a[normalize-space(string(.)) = "%s"]' % value
+        if by == By.PARTIAL_LINK_TEXT:
+            return './/a[contains(string(.), "%s")]' % value
+        if by == By.TAG_NAME:
+            return './/%s' % value
+        return value
+
+    def find_elements(self, by=By.ID, value=None, root=None):
+        root = self.document if root is None else root
+        if by == By.CSS_SELECTOR:
+            nodes = root.cssselect(value)
+        else:
+            nodes = root.xpath(self.xpath_for(by, value))
+        return [HttpElement(self, node) for node in nodes
+                if isinstance(node, lxml.html.HtmlElement)]
+
+    def find_element(self, by=By.ID, value=None, root=None):
+        elements = self.find_elements(by, value, root)
+        if not elements:
+            raise NoSuchElementException('Unable to locate %s: %s' % (by, value))
+        return elements[0]
+
+    def find_element_by_id(self, id_):
+        return self.find_element(By.ID, id_)
+
+    def find_element_by_xpath(self, xpath):
+        return self.find_element(By.XPATH, xpath)
+
+    def find_elements_by_xpath(self, xpath):
+        return self.find_elements(By.XPATH, xpath)
+
+    def find_element_by_class_name(self, name):
+        return self.find_element(By.CLASS_NAME, name)
+
+    def find_elements_by_class_name(self, name):
+        return self.find_elements(By.CLASS_NAME, name)
+
+    def find_element_by_css_selector(self, selector):
+        return self.find_element(By.CSS_SELECTOR, selector)
+
+    def find_elements_by_css_selector(self, selector):
+        return self.find_elements(By.CSS_SELECTOR, selector)
+
+    def find_element_by_link_text(self, text):
+        return self.find_element(By.LINK_TEXT, text)
+
+    def find_element_by_tag_name(self, name):
+        return self.find_element(By.TAG_NAME, name)
+
+    def find_elements_by_tag_name(self, name):
+        return self.find_elements(By.TAG_NAME, name)
+
+    def add_cookie(self, cookie):
+        domain = cookie.get('domain')
+        if not domain:
+            # a host-only cookie of the open page, the cookie jar matches
+            # hosts without a dot, like localhost, as host.local
+            domain = urlparse(self.current_url).hostname
+            if '.' not in domain:
+                domain += '.local'
+        self.session.cookies.set(cookie['name'], cookie['value'],
+                                 domain=domain, path=cookie.get('path', '/'))
+
+    def get_cookies(self):
+        return [{'name': cookie.name, 'value': cookie.value,
+                 'domain': cookie.domain, 'path': cookie.path}
+                for cookie in self.session.cookies]
+
+    def delete_all_cookies(self):
+        self.session.cookies.clear()
+
+    def execute_script(self, script, *args):
+        raise WebDriverException('HttpDriver does not run JavaScript')
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def set_window_size(self, width, height):
+        pass
+
+    def maximize_window(self):
+        pass
+
+    def quit(self):
+        self.session.close()
@@ -0,0 +1,103 @@
+import os
+import threading
+
+try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue
+
+from django.conf import settings
+from django.core.servers.basehttp import WSGIServer
+from django.db import connections
+from django.test.testcases import LiveServerThread, QuietWSGIRequestHandler
+
+# Threads serving the requests of the live server. 1 keeps Django's server,
+# which handles one request at a time.
+SERVER_WORKERS = int(os.environ.get('VMS_TEST_SERVER_WORKERS', 1))
+
+
+class PooledWSGIServer(WSGIServer):
+    """
+    WSGI server handing accepted requests to a fixed pool of worker threads,
+    so the assets and XHR requests of a page are served concurrently.
+
+    - Workers use the connections shared by the test, if any, like the
+      server thread does
+    - A shared connection can not run queries of several threads at once,
+      so while connections are shared only static files are served
+      concurrently and views are run one at a time
+    - The workers close their own connections when the server is closed
+    """
+
+    def __init__(self, address, handler_class, workers, connections_override,
+                 **kwargs):
+        # the socketserver classes are old-style classes on Python 2
+        WSGIServer.__init__(self, address, handler_class, **kwargs)
+        self.connections_override = connections_override or {}
+        self.view_lock = threading.Lock()
+        self.requests = Queue()
+        self.workers = []
+        for _ in range(workers):
+            worker = threading.Thread(target=self.process_queue)
+            worker.daemon = True
+            worker.start()
+            self.workers.append(worker)
+
+    def set_app(self, application):
+        if self.connections_override:
+            application = self.serialize_views(application)
+        WSGIServer.set_app(self, application)
+
+    def serialize_views(self, application):
+        def serialized(environ, start_response):
+            if environ.get('PATH_INFO', '').startswith(settings.STATIC_URL):
+                return application(environ, start_response)
+            with self.view_lock:
+                return application(environ, start_response)
+        return serialized
+
+    def process_request(self, request, client_address):
+        self.requests.put((request, client_address))
+
+    def process_queue(self):
+        for alias, connection in self.connections_override.items():
+            connections[alias] = connection
+        while True:
+            request, client_address = self.requests.get()
+            if request is None:
+                break
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+        for connection in connections.all():
+            if connection.alias not in self.connections_override:
+                connection.close()
+
+    def server_close(self):
+        WSGIServer.server_close(self)
+        for _ in self.workers:
+            self.requests.put((None, None))
+        for worker in self.workers:
+            # a worker stuck on a request must not hang the test run
+            worker.join(5)
+
+
+class PooledLiveServerThread(LiveServerThread):
+    """
+    Live server thread serving requests with a PooledWSGIServer of
+    `workers` threads, or with Django's server for a single worker
+    """
+
+    workers = SERVER_WORKERS
+
+    def _create_server(self, *args):
+        if self.workers <= 1:
+            return super(PooledLiveServerThread, self)._create_server(*args)
+        # Django 1.11 passes the port to try, later versions use self.port
+        port = args[0] if args else self.port
+        return PooledWSGIServer(
+            (self.host, port), QuietWSGIRequestHandler, self.workers,
+            self.connections_override, allow_reuse_address=False)
@@ -0,0 +1,177 @@
+import re
+
+from selenium.webdriver.common.by import By
+
+# Locators starting like this are xpaths, ones with these characters css
+XPATH_PREFIXES = ('/', './', '(', 'id(', 'html/')
+CSS_CHARACTERS = re.compile(r'^\.|[\[\]#>:]')
+
+XPATH_STEP = re.compile(
+    r'(?P<axis>//|/)(?P<tag>\*|[a-zA-Z][\w-]*)(?P<predicates>(?:\[[^\]]*\])*)')
+XPATH_PREDICATE = re.compile(
+    r'\[\s*(?:(?P<index>\d+)|@(?P<attribute>[\w-]+)\s*=\s*'
+    r'(?P<quote>["\'])(?P<value>[^"\']*)(?P=quote))\s*\]')
+XPATH_ID_FUNCTION = re.compile(r'id\((?P<quote>["\'])(?P<id>[\w-]+)(?P=quote)\)')
+CSS_IDENTIFIER = re.compile(r'^[a-zA-Z][\w-]*$')
+
+# Every registered locator by '<locator class>.<name>'
+registry = {}
+
+
+class Locator(str):
+    """
+    Locator string tagged with the strategy (`by`) and value it is looked up
+    with. It is still the original string, so pages can extend it or pass
+    it to any BasePage lookup. `by` is None for ids, class names and link
+    texts, which are looked up with the strategy of the method they are
+    passed to.
+    """
+
+    def __new__(cls, string, by=None, value=None):
+        locator = super(Locator, cls).__new__(cls, string)
+        locator.by = by
+        locator.value = string if value is None else value
+        return locator
+
+
+def check_balanced(string):
+    """
+    Fallback syntax check when lxml or cssselect are not installed
+    """
+    closing = {'[': ']', '(': ')'}
+    expected = []
+    quote = None
+    for character in string:
+        if quote:
+            if character == quote:
+                quote = None
+        elif character in '"\'':
+            quote = character
+        elif character in closing:
+            expected.append(closing[character])
+        elif character in ')]':
+            if not expected or expected.pop() != character:
+                return False
+    return quote is None and not expected
+
+
+def validate_xpath(string):
+    try:
+        from lxml import etree
+    except ImportError:
+        if not check_balanced(string):
+            raise ValueError('unbalanced brackets or quotes')
+        return
+    try:
+        etree.XPath(string)
+    except etree.XPathSyntaxError as error:
+        raise ValueError(str(error))
+
+
+def validate_css(string):
+    try:
+        import cssselect
+    except ImportError:
+        if not check_balanced(string):
+            raise ValueError('unbalanced brackets or quotes')
+        return
+    try:
+        cssselect.parse(string)
+    except cssselect.SelectorError as error:
+        raise ValueError(str(error))
+
+
+def xpath_to_css(xpath):
+    """
+    Returns the css selector matching the same elements as xpath, or None if
+    xpath uses more than tags, positions, attribute equality and id()
+    """
+    selector = ''
+    path = xpath
+    match = XPATH_ID_FUNCTION.match(path)
+    if match:
+        selector = '#' + match.group('id')
+        path = path[match.end():]
+    elif path.startswith('.//'):
+        path = path[1:]
+    elif not path.startswith('/'):
+        # relative to the document, like 'html/body'
+        path = '/' + path
+
+    position = 0
+    while position < len(path):
+        step = XPATH_STEP.match(path, position)
+        if step is None:
+            return None
+        tag = step.group('tag')
+        part = '' if tag == '*' else tag
+        predicates = step.group('predicates')
+        matched = 0
+        for predicate in XPATH_PREDICATE.finditer(predicates):
+            if predicate.start() != matched:
+                return None
+            matched = predicate.end()
+            if predicate.group('index'):
+                if tag == '*':
+                    return None
+                part += ':nth-of-type(%s)' % predicate.group('index')
+            elif predicate.group('attribute') == 'id' and \
+                    CSS_IDENTIFIER.match(predicate.group('value')):
+                part += '#' + predicate.group('value')
+            else:
+                part += '[%s="%s"]' % (predicate.group('attribute'),
+                                       predicate.group('value'))
+        if matched != len(predicates) or not part:
+            return None
+        if selector:
+            selector += ' ' if step.group('axis') == '//' else ' > '
+        selector += part
+        position = step.end()
+    return selector or None
+
+
+def parse_locator(label, string):
+    """
+    Validates a locator and returns it as a Locator, preferring css over an
+    equivalent xpath. Raises ValueError naming the locator if it is invalid.
+    """
+    if not string or string != string.strip():
+        raise ValueError('%s: empty or padded locator %r' % (label, string))
+    try:
+        if string.startswith(XPATH_PREFIXES):
+            validate_xpath(string)
+            css = xpath_to_css(string)
+            if css:
+                return Locator(string, By.CSS_SELECTOR, css)
+            return Locator(string, By.XPATH)
+        if CSS_CHARACTERS.search(string):
+            validate_css(string)
+            return Locator(string, By.CSS_SELECTOR)
+    except ValueError as error:
+        raise ValueError('%s: invalid locator %r: %s' % (label, string, error))
+    return Locator(string)
+
+
+def register_locators(cls):
+    """
+    Class decorator of the locator classes. Replaces their upper case string
+    attributes by validated Locators and adds them to the registry, so an
+    invalid locator fails when its page is imported.
+    """
+    for name, string in list(vars(cls).items()):
+        if name.isupper() and isinstance(string, str):
+            label = '%s.%s' % (cls.__name__, name)
+            locator = parse_locator(label, string)
+            setattr(cls, name, locator)
+            registry[label] = locator
+    return cls
+
+
+def resolve_locator(by, value):
+    """
+    Returns the strategy and value to look up value with, by unless value
+    is a Locator with a strategy of its own
+    """
+    if getattr(value, 'by', None):
+        return value.by, value.value
+    return by, value
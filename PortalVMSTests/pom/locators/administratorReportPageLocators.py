@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class AdministratorReportPageLocators(object):
 
 	REPORT_SHIFT_SUMMARY_PATH = '//div[2]/div[4]'
@@ -15,6 +17,7 @@ class AdministratorReportPageLocators(object):
 	START_TIME = '//table//tbody//tr[1]//td[7]'
 	END_TIME = '//table//tbody//tr[1]//td[8]'
 	HOURS = '//table//tbody//tr[1]//td[9]'
+	REPORT_TABLE = '//table'
 
 	SUBMIT_PATH = '//form[1]'
 	NO_RESULT_BOX = 'alert-danger'
@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class AuthenticationPageLocators(object):
 
 	LOGIN_ID = 'id_login'
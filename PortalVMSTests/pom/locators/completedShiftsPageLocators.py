@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class CompletedShiftsPageLocators(object):
 
     SHIFT_JOB_PATH = '//table//tbody//tr[1]//td[1]'
@@ -7,6 +9,7 @@ class CompletedShiftsPageLocators(object):
     SHIFT_ETIME_PATH = '//table//tbody//tr[1]//td[4]'
     SHIFT_EDIT_PATH = '//table//tbody//tr[1]//td[5]'
     SHIFT_CLEAR_PATH = '//table//tbody//tr[1]//td[6]'
+    SHIFT_TABLE = '//table'
     START_TIME_FORM = '//input[@name = "start_time"]'
     END_TIME_FORM = '//input[@name = "end_time"]'
     CLEAR_SHIFT_HOURS_TEXT = 'html/body/div[2]/form/div/div[1]/h3'
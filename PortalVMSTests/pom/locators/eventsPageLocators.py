@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class EventsPageLocators(object):
 
 	# locators for events, jobs, shifts  listed
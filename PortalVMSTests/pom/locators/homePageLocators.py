@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class HomePageLocators(object):
 
 	ADMIN_REPORT_TEXT = 'Report'
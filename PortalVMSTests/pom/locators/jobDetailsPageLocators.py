@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class JobDetailsPageLocators(object):
 
 	JOB_NAME = '//table[1]//tr//td[1]'
@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class ManageShiftPageLocators(object):
 
     CANCEL_SHIFT_PATH = '//table//tbody//tr[1]//td[5]'
@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class ShiftDetailsPageLocators(object):
 	VOL_EMAIL = '//table[2]//tr//td[9]'
 	MAX_VOL = '//table[1]//tr//td[9]'
@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class UpcomingShiftsPageLocators(object):
 
 	SHIFT_JOB_PATH = '//table//tbody//tr[1]//td[1]'
@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class VolunteerProfilePageLocators(object):
 
 	PROFILE_FIRST_NAME = '//input[@name = "first_name"]'
@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class VolunteerRegistrationPageLocators(object):
 
 	USERNAME = 'id_username'
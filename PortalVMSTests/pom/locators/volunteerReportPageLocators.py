@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class VolunteerReportPageLocators(object):
 
 	REPORT_START_DATE = '//input[@name = "start_date"]'
@@ -6,5 +8,6 @@ class VolunteerReportPageLocators(object):
 	REPORT_EVENT_SELECTOR = '//select[@name = "event_name"]'
 	REPORT_JOB_SELECTOR = '//select[@name = "job_name"]'
 	REPORT_SHIFT_SUMMARY_PATH = '//div[2]/div[4]'
+	REPORT_TABLE = '//table'
 	NO_RESULT_BOX = 'alert-danger'
 	SUBMIT_PATH = '//form[1]'
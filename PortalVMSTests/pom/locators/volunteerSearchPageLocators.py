@@ -1,4 +1,6 @@
+from pom.locatorRegistry import register_locators
 
+@register_locators
 class VolunteerSearchPageLocators(object):
 
 	FIRST_NAME_FIELD = ".form-control[name='first_name']"
@@ -0,0 +1,116 @@
+import atexit
+import csv
+import functools
+import inspect
+import json
+import os
+import time
+
+# BasePage methods whose first two arguments are the locator they look up
+LOCATOR_METHODS = ('find', 'find_all', 'wait_until_visible', 'wait_until_absent')
+COLUMNS = ('kind', 'test', 'owner', 'name', 'count', 'seconds')
+
+
+class PageProfiler(object):
+    """
+    Opt-in timings of page object calls and WebDriver commands.
+
+    - Enabled by setting VMS_TEST_PROFILE to the file the profile is written
+      to when the process exits, csv if it ends with .csv and json otherwise
+    - Every public page object method, element lookup (per locator) and
+      WebDriver command is counted and timed per test. Times of page object
+      methods include the page object methods they call.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.test = None
+        self.records = {}
+
+    @property
+    def enabled(self):
+        return bool(self.path)
+
+    def record(self, kind, owner, name, seconds):
+        key = (kind, self.test or '-', owner, name)
+        count, total = self.records.get(key, (0, 0.0))
+        self.records[key] = (count + 1, total + seconds)
+
+    def timed(self, function, kind, owner, name):
+        @functools.wraps(function)
+        def call(*args, **kwargs):
+            start = time.time()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                duration = time.time() - start
+                self.record(kind, owner, name, duration)
+                if name in LOCATOR_METHODS and len(args) >= 2:
+                    self.record('locator', owner, '%s=%s' % args[:2], duration)
+        return call
+
+    def instrument_page(self, page):
+        owner = type(page).__name__
+        for name, method in inspect.getmembers(page, inspect.ismethod):
+            if not name.startswith('_'):
+                setattr(page, name, self.timed(method, 'page', owner, name))
+
+    def instrument_driver(self, driver):
+        # selenium sends every command through execute, HttpDriver has none
+        if hasattr(driver, 'execute'):
+            driver.execute = self.command_timer(driver)
+
+    def command_timer(self, driver):
+        execute = driver.execute
+        owner = type(driver).__name__
+
+        def timed_execute(command, params=None):
+            start = time.time()
+            try:
+                return execute(command, params)
+            finally:
+                self.record('command', owner, command, time.time() - start)
+        return timed_execute
+
+    def rows(self):
+        """
+        Returns the records as rows of COLUMNS, slowest first
+        """
+        rows = [list(key) + [count, total]
+                for key, (count, total) in self.records.items()]
+        return sorted(rows, key=lambda row: -row[-1])
+
+    def totals(self):
+        """
+        Returns the records summed over all tests, slowest first
+        """
+        totals = {}
+        for kind, test, owner, name, count, seconds in self.rows():
+            key = (kind, owner, name)
+            total_count, total_seconds = totals.get(key, (0, 0.0))
+            totals[key] = (total_count + count, total_seconds + seconds)
+        rows = [list(key) + [count, seconds]
+                for key, (count, seconds) in totals.items()]
+        return sorted(rows, key=lambda row: -row[-1])
+
+    def write(self, path=None):
+        path = path or self.path
+        if not path or not self.records:
+            return
+        if path.endswith('.csv'):
+            with open(path, 'w') as profile_file:
+                writer = csv.writer(profile_file)
+                writer.writerow(COLUMNS)
+                writer.writerows(self.rows())
+        else:
+            columns = [column for column in COLUMNS if column != 'test']
+            profile = {
+                'totals': [dict(zip(columns, row)) for row in self.totals()],
+                'records': [dict(zip(COLUMNS, row)) for row in self.rows()],
+                }
+            with open(path, 'w') as profile_file:
+                json.dump(profile, profile_file, indent=2)
+
+
+profiler = PageProfiler(os.environ.get('VMS_TEST_PROFILE'))
+atexit.register(profiler.write)
@@ -47,3 +47,6 @@ class AdministratorReportPage(BasePage):
 
     def get_shift_summary(self):
         return self.element_by_xpath(self.elements.REPORT_SHIFT_SUMMARY_PATH).text
+
+    def get_report_rows(self, as_dicts=False):
+        return self.get_table(self.elements.REPORT_TABLE, as_dicts)
@@ -1,13 +1,25 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.models import User
+
 from basePage import *
 from pom.locators.authenticationPageLocators import *
 from pom.locators.homePageLocators import *
 from pom.pageUrls import PageUrls
 
 class AuthenticationPage(BasePage):
+    """
+    Logs users in either through the login form or, by default, by creating
+    a session server-side and injecting its cookie into the browser.
+    Tests that exercise the login form itself set `login_mode = 'form'`.
+    """
 
     url = PageUrls.authentication_page
     homepage = PageUrls.homepage
     server_url = ''
+    login_mode = 'session'
 
     def __init__(self, driver):
         self.elements = AuthenticationPageLocators()
@@ -15,11 +27,42 @@ class AuthenticationPage(BasePage):
         super(AuthenticationPage, self).__init__(driver)
 
     def login(self,credentials):
+        if self.login_mode == 'form':
+            self.login_with_form(credentials)
+        else:
+            self.login_with_session(credentials)
+
+    def login_with_form(self,credentials):
         self.get_page(self.server_url, self.url)
         self.send_value_to_element_id(self.elements.LOGIN_ID,credentials['username'])
         self.send_value_to_element_id(self.elements.LOGIN_PASSWORD,credentials['password'])
         self.element_by_xpath(self.elements.SUBMIT_PATH).submit()
 
+    def login_with_session(self,credentials):
+        """
+        - Creates an authenticated session for the user with the passed
+          username, the password is not checked
+        - Sets the session cookie in the browser and opens the homepage,
+          where the login form would have redirected to
+        """
+        user = User.objects.get(username=credentials['username'])
+        engine = import_module(settings.SESSION_ENGINE)
+        session = engine.SessionStore()
+        session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.save()
+
+        # cookies can only be set for the domain of the page that is open
+        if not self.driver.current_url.startswith(self.server_url):
+            self.get_page(self.server_url, self.homepage)
+        self.driver.add_cookie({
+            'name': settings.SESSION_COOKIE_NAME,
+            'value': session.session_key,
+            'path': '/'
+            })
+        self.get_page(self.server_url, self.homepage)
+
     def go_to_authentication_page(self):
         self.click_link(self.home.LOGIN_TEXT)
 
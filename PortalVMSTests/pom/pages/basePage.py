@@ -1,51 +1,277 @@
+import os
+import time
+
+from selenium.common.exceptions import (NoSuchElementException,
+                                        StaleElementReferenceException,
+                                        WebDriverException)
+from selenium.webdriver.common.by import By
+
+from pom.locatorRegistry import resolve_locator
+from pom.pageProfiler import profiler
+
 
 class BasePage(object):
     """Base class to initialize the base page that will be called from all pages"""
 
+    # Lookups poll every poll_interval seconds for at most timeout seconds.
+    # An element still missing settle_time seconds after the page finished
+    # loading is reported missing right away instead of after the timeout.
+    timeout = float(os.environ.get('VMS_TEST_WAIT_TIMEOUT', 5))
+    poll_interval = float(os.environ.get('VMS_TEST_POLL_INTERVAL', 0.1))
+    settle_time = float(os.environ.get('VMS_TEST_SETTLE_TIME', 0.3))
+
+    # 'script' fills forms with one script, 'keys' types into every field
+    fill_mode = 'script'
+    fill_fields_script = """
+        var fields = arguments[0], fireEvents = arguments[1], states = [];
+        for (var i = 0; i < fields.length; i++) {
+            var node = document.evaluate(fields[i][0], document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            if (!node) {
+                states.push(null);
+                continue;
+            }
+            var value = fields[i][1];
+            if (node.tagName == 'SELECT') {
+                // like typing into a select, picks the first matching option
+                for (var j = 0; j < node.options.length; j++) {
+                    if (node.options[j].text.trim().indexOf(value) == 0) {
+                        node.selectedIndex = j;
+                        break;
+                    }
+                }
+            } else {
+                node.value = value;
+            }
+            if (fireEvents) {
+                ['input', 'change'].forEach(function (type) {
+                    var event = document.createEvent('HTMLEvents');
+                    event.initEvent(type, true, true);
+                    node.dispatchEvent(event);
+                });
+            }
+            states.push({
+                valid: node.checkValidity ? node.checkValidity() : true,
+                message: node.validationMessage || ''
+            });
+        }
+        return states;
+    """
+    table_script = """
+        var node = arguments[0], asDicts = arguments[1];
+        var table = node.tagName == 'TABLE' ? node : node.parentNode;
+        var body = node.tagName == 'TBODY' ? node : (table.tBodies[0] || table);
+        var text = function (cell) {
+            return (cell.innerText || cell.textContent).replace(/\\s+/g, ' ').trim();
+        };
+        var headers = [];
+        if (table.tHead && table.tHead.rows.length) {
+            var headerRow = table.tHead.rows[table.tHead.rows.length - 1];
+            for (var i = 0; i < headerRow.cells.length; i++) {
+                headers.push(text(headerRow.cells[i]));
+            }
+        }
+        var rows = [];
+        for (var i = 0; i < body.rows.length; i++) {
+            var cells = body.rows[i].cells, row = asDicts ? {} : [];
+            for (var j = 0; j < cells.length; j++) {
+                if (asDicts) {
+                    row[headers[j] || String(j)] = text(cells[j]);
+                } else {
+                    row.push(text(cells[j]));
+                }
+            }
+            rows.push(row);
+        }
+        return rows;
+    """
+
     def __init__(self, driver):
         self.driver = driver
+        if profiler.enabled:
+            profiler.instrument_page(self)
+
+    def page_loaded(self):
+        try:
+            return self.driver.execute_script(
+                'return document.readyState') == 'complete'
+        except WebDriverException:
+            return False
+
+    def wait_for(self, condition, timeout=None, settle=True, message=''):
+        """
+        - Calls condition(driver) until it returns a true value, and returns
+          that value. selenium's expected_conditions can be passed as well.
+        - NoSuchElementException and StaleElementReferenceException raised
+          by condition count as not true yet
+        - Gives up after timeout seconds, or with settle once the page has
+          been loaded for settle_time seconds, and raises
+          NoSuchElementException(message)
+        """
+        timeout = self.timeout if timeout is None else timeout
+        if not getattr(self.driver, 'javascript_enabled', True):
+            # pages without scripts are final as soon as they are fetched
+            timeout = 0
+        deadline = time.time() + timeout
+        settled_since = None
+        while True:
+            try:
+                result = condition(self.driver)
+                if result:
+                    return result
+            except (NoSuchElementException, StaleElementReferenceException):
+                pass
+            now = time.time()
+            if now >= deadline:
+                break
+            if settle:
+                if not self.page_loaded():
+                    settled_since = None
+                elif settled_since is None:
+                    settled_since = now
+                elif now - settled_since >= self.settle_time:
+                    break
+            time.sleep(self.poll_interval)
+        raise NoSuchElementException(message)
+
+    def find(self, by, value, timeout=None):
+        by, value = resolve_locator(by, value)
+        return self.wait_for(lambda driver: driver.find_element(by, value),
+                             timeout,
+                             message='Unable to locate %s: %s' % (by, value))
+
+    def find_all(self, by, value, timeout=None):
+        """
+        Returns the matching elements, or None if there are none once the
+        page has settled
+        """
+        by, value = resolve_locator(by, value)
+        try:
+            return self.wait_for(
+                lambda driver: driver.find_elements(by, value), timeout)
+        except NoSuchElementException:
+            return None
+
+    def wait_until_visible(self, by, value, timeout=None):
+        by, value = resolve_locator(by, value)
+        def visible_element(driver):
+            element = driver.find_element(by, value)
+            return element if element.is_displayed() else None
+        return self.wait_for(visible_element, timeout, settle=False,
+                             message='%s: %s is not visible' % (by, value))
+
+    def wait_until_absent(self, by, value, timeout=None):
+        """
+        Waits for the element to be removed from the page and returns True,
+        or False if it is still present after timeout seconds
+        """
+        by, value = resolve_locator(by, value)
+        try:
+            return self.wait_for(
+                lambda driver: not driver.find_elements(by, value),
+                timeout, settle=False)
+        except NoSuchElementException:
+            return False
+
+    def fill_fields(self, fields, fire_events=True):
+        """
+        - Fills the fields, a list of (xpath, value) pairs, and returns the
+          validation state of each field as a {'valid', 'message'} dict,
+          or None when the browser does not run scripts
+        - With fill_mode 'script' all fields are set and validated by one
+          script, with fire_events firing their input and change events.
+          With fill_mode 'keys' every field is cleared and typed into.
+        """
+        if self.fill_mode == 'keys' or \
+                not getattr(self.driver, 'javascript_enabled', True):
+            return self.fill_fields_with_keys(fields)
+        return self.fill_fields_with_script(fields, fire_events)
+
+    def fill_fields_with_keys(self, fields):
+        for xpath, value in fields:
+            element = self.element_by_xpath(xpath)
+            if element.tag_name != 'select':
+                element.clear()
+            element.send_keys(value)
+        return [None] * len(fields)
+
+    def fill_fields_with_script(self, fields, fire_events=True):
+        # the form is there once its first field is
+        self.element_by_xpath(fields[0][0])
+        states = self.driver.execute_script(
+            self.fill_fields_script,
+            [[xpath, '%s' % value] for xpath, value in fields], fire_events)
+        for (xpath, value), state in zip(fields, states):
+            if state is None:
+                raise NoSuchElementException(
+                    'Unable to locate %s: %s' % (By.XPATH, xpath))
+        return states
+
+    def get_table(self, table='//table', as_dicts=False):
+        """
+        - Returns the rows of the body of a table as lists of cell texts, or
+          with as_dicts as dicts keyed by the column headers
+        - table is the xpath of the table or a table or tbody element
+        - All rows are read by a single script
+        """
+        if not hasattr(table, 'tag_name'):
+            table = self.element_by_xpath(table)
+        if getattr(self.driver, 'javascript_enabled', True):
+            return self.driver.execute_script(
+                self.table_script, table, as_dicts)
+
+        # without scripts read the cells one by one
+        table_path = '..' if table.tag_name == 'tbody' else '.'
+        rows_path = './tr' if table.tag_name == 'tbody' else './tbody/tr|./tr'
+        headers = [cell.text for cell in table.find_elements_by_xpath(
+            table_path + '/thead/tr[last()]/*')]
+        rows = [[cell.text for cell in row.find_elements_by_xpath('./td|./th')]
+                for row in table.find_elements_by_xpath(rows_path)]
+        if not as_dicts:
+            return rows
+        return [dict((headers[index] if index < len(headers) and
+                      headers[index] else str(index), cell)
+                     for index, cell in enumerate(row)) for row in rows]
 
     def send_value_to_element_id(self, key, value):
-    	self.driver.find_element_by_id(key).send_keys(value)
+        self.find(By.ID, key).send_keys(value)
 
     def send_value_to_xpath(self, key, value):
-        self.driver.find_element_by_xpath(key).send_keys(value)
+        self.find(By.XPATH, key).send_keys(value)
 
     def element_by_xpath(self, path):
-    	return self.driver.find_element_by_xpath(path)
+        return self.find(By.XPATH, path)
 
     def elements_by_xpath(self, path):
-        elements = self.driver.find_elements_by_xpath(path)
-        return elements if elements else None
+        return self.find_all(By.XPATH, path)
 
     def get_page(self, base, relative_url):
-    	self.driver.get(base + relative_url)
+        self.driver.get(base + relative_url)
 
     def elements_by_class_name(self, class_name):
-    	elements = self.driver.find_elements_by_class_name(class_name)  	
-    	return elements if elements else None
+        return self.find_all(By.CLASS_NAME, class_name)
 
     def find_element_by_css_selector(self, selector):
-        return self.driver.find_element_by_css_selector(selector)
+        return self.find(By.CSS_SELECTOR, selector)
 
     def element_by_class_name(self,class_name):
-        return self.driver.find_element_by_class_name(class_name)
+        return self.find(By.CLASS_NAME, class_name)
 
     def get_value_for(self, field):
-        return self.driver.find_element_by_id(field).get_attribute('value')
+        return self.find(By.ID, field).get_attribute('value')
 
     def click_link(self, link_text):
-        self.driver.find_element_by_link_text(link_text).click()
+        self.find(By.LINK_TEXT, link_text).click()
 
     def find_link(self, link_text):
-        element = self.driver.find_element_by_link_text(link_text)
+        element = self.find(By.LINK_TEXT, link_text)
         return element if element else None
 
     def element_by_id(self, id_name):
-        return self.driver.find_element_by_id(id_name)
+        return self.find(By.ID, id_name)
 
     def get_value_for_xpath(self, xpath):
-        return self.driver.find_element_by_xpath(xpath).get_attribute('value')
+        return self.find(By.XPATH, xpath).get_attribute('value')
 
     def element_by_tag_name(self, tag):
-        return self.driver.find_element_by_tag_name(tag)
+        return self.find(By.TAG_NAME, tag)
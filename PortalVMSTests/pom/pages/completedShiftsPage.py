@@ -33,6 +33,9 @@ class CompletedShiftsPage(BasePage):
     def get_info_box(self):
         return self.element_by_class_name(self.elements.INFO_BOX).text
 
+    def get_shifts(self, as_dicts=False):
+        return self.get_table(self.elements.SHIFT_TABLE, as_dicts)
+
     def get_danger_box(self):
     	return self.element_by_class_name(self.elements.DANGER_BOX)
 
@@ -25,38 +25,34 @@ class EventsPage(BasePage):
         super(EventsPage, self).__init__(driver)
 
     def fill_event_form(self, event):
-        self.element_by_xpath(self.elements.CREATE_EVENT_NAME).clear()
-        self.element_by_xpath(self.elements.CREATE_EVENT_START_DATE).clear()
-        self.element_by_xpath(self.elements.CREATE_EVENT_END_DATE).clear()
-        self.send_value_to_xpath(self.elements.CREATE_EVENT_NAME, event[0])
-        self.send_value_to_xpath(self.elements.CREATE_EVENT_START_DATE, event[1])
-        self.send_value_to_xpath(self.elements.CREATE_EVENT_END_DATE, event[2])
+        states = self.fill_fields([
+            (self.elements.CREATE_EVENT_NAME, event[0]),
+            (self.elements.CREATE_EVENT_START_DATE, event[1]),
+            (self.elements.CREATE_EVENT_END_DATE, event[2])
+            ])
         self.submit_form()
+        return states
 
     def fill_job_form(self, job):
-        self.element_by_xpath(self.elements.CREATE_JOB_NAME).clear()
-        self.element_by_xpath(self.elements.CREATE_JOB_DESCRIPTION).clear()
-        self.element_by_xpath(self.elements.CREATE_JOB_START_DATE).clear()
-        self.element_by_xpath(self.elements.CREATE_JOB_END_DATE).clear()
-
-        self.send_value_to_xpath(self.elements.CREATE_EVENT_ID,job[0])
-        self.send_value_to_xpath(self.elements.CREATE_JOB_NAME,job[1])
-        self.send_value_to_xpath(self.elements.CREATE_JOB_DESCRIPTION,job[2])
-        self.send_value_to_xpath(self.elements.CREATE_JOB_START_DATE,job[3])
-        self.send_value_to_xpath(self.elements.CREATE_JOB_END_DATE,job[4])
+        states = self.fill_fields([
+            (self.elements.CREATE_EVENT_ID, job[0]),
+            (self.elements.CREATE_JOB_NAME, job[1]),
+            (self.elements.CREATE_JOB_DESCRIPTION, job[2]),
+            (self.elements.CREATE_JOB_START_DATE, job[3]),
+            (self.elements.CREATE_JOB_END_DATE, job[4])
+            ])
         self.submit_form()
+        return states
 
     def fill_shift_form(self, shift):
-        self.element_by_xpath(self.elements.CREATE_SHIFT_DATE).clear()
-        self.element_by_xpath(self.elements.CREATE_SHIFT_START_TIME).clear()
-        self.element_by_xpath(self.elements.CREATE_SHIFT_END_TIME).clear()
-        self.element_by_xpath(self.elements.CREATE_SHIFT_MAX_VOLUNTEER).clear()
-
-        self.send_value_to_xpath(self.elements.CREATE_SHIFT_DATE,shift[0])
-        self.send_value_to_xpath(self.elements.CREATE_SHIFT_START_TIME,shift[1])
-        self.send_value_to_xpath(self.elements.CREATE_SHIFT_END_TIME,shift[2])
-        self.send_value_to_xpath(self.elements.CREATE_SHIFT_MAX_VOLUNTEER,shift[3])
+        states = self.fill_fields([
+            (self.elements.CREATE_SHIFT_DATE, shift[0]),
+            (self.elements.CREATE_SHIFT_START_TIME, shift[1]),
+            (self.elements.CREATE_SHIFT_END_TIME, shift[2]),
+            (self.elements.CREATE_SHIFT_MAX_VOLUNTEER, shift[3])
+            ])
         self.submit_form()
+        return states
 
     def fill_organization_form(self, org):
         self.element_by_xpath(self.elements.ORG_NAME).clear()
@@ -170,7 +166,7 @@ class EventsPage(BasePage):
         return self.element_by_xpath(self.elements.SHIFT_START_TIME_ERROR).text
 
     def get_shift_end_time_error(self):
-        return self.driver.find_element_by_xpath(self.elements.SHIFT_END_TIME_ERROR).text
+        return self.element_by_xpath(self.elements.SHIFT_END_TIME_ERROR).text
 
     def get_shift_max_volunteer_error(self):
         return self.element_by_xpath(self.elements.SHIFT_MAX_VOLUNTEER_ERROR).text
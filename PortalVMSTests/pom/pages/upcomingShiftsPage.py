@@ -28,6 +28,9 @@ class UpcomingShiftsPage(BasePage):
     def get_result_container(self):
         return self.element_by_xpath(self.elements.CONTAINER)
 
+    def get_shifts(self, as_dicts=False):
+        return self.get_table(self.elements.CONTAINER, as_dicts)
+
     def get_shift_job(self):
         return self.element_by_xpath(self.elements.SHIFT_JOB_PATH).text
 
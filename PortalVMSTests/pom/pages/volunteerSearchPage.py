@@ -47,10 +47,8 @@ class VolunteerSearchPage(BasePage):
         return search_results
 
     def get_results_list(self, search_results):
+        # words of each row, like splitting the text of the row
+        return [' '.join(row).split() for row in self.get_table(search_results)]
 
-        result = []
-        for tr in search_results.find_elements_by_tag_name('tr'):
-            row = tr.text.split()
-            result.append(row)
-
-        return result
+    def get_results_table(self):
+        return self.get_table(self.elements.RESULT_BODY, as_dicts=True)
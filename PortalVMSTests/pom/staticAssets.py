@@ -0,0 +1,102 @@
+import os
+import re
+
+from django.contrib.staticfiles.handlers import StaticFilesHandler
+from django.http import HttpResponse
+
+# Static assets are served from memory unless VMS_TEST_STATIC_CACHE=off.
+# VMS_TEST_BLOCK_ASSETS lists the kinds of BLOCKED_ASSETS not to load at
+# all, for ex. 'fonts,analytics'.
+CACHE_MAX_AGE = 365 * 24 * 60 * 60
+
+# Paths served by the live server and external hosts of each kind
+BLOCKED_ASSETS = {
+    'fonts': {
+        'paths': re.compile(r'\.(woff2?|ttf|otf|eot)$', re.IGNORECASE),
+        'hosts': ['fonts.googleapis.com', 'fonts.gstatic.com'],
+        },
+    'analytics': {
+        'paths': re.compile(r'(analytics|gtag|tracking)[\w.-]*\.js$',
+                            re.IGNORECASE),
+        'hosts': ['www.google-analytics.com', 'ssl.google-analytics.com',
+                  'www.googletagmanager.com', 'stats.g.doubleclick.net'],
+        },
+    }
+
+
+def cache_enabled():
+    return os.environ.get('VMS_TEST_STATIC_CACHE', 'on') != 'off'
+
+
+def get_blocked_kinds():
+    kinds = [kind.strip() for kind in
+             os.environ.get('VMS_TEST_BLOCK_ASSETS', '').split(',')
+             if kind.strip()]
+    for kind in kinds:
+        if kind not in BLOCKED_ASSETS:
+            raise ValueError('VMS_TEST_BLOCK_ASSETS entries must be in %s, '
+                             'not %r' % (', '.join(sorted(BLOCKED_ASSETS)),
+                                         kind))
+    return kinds
+
+
+def get_blocked_hosts():
+    """
+    Returns the external hosts the browser should not connect to
+    """
+    return [host for kind in get_blocked_kinds()
+            for host in BLOCKED_ASSETS[kind]['hosts']]
+
+
+def is_blocked_path(path):
+    return any(BLOCKED_ASSETS[kind]['paths'].search(path)
+               for kind in get_blocked_kinds())
+
+
+def get_proxy_script(hosts):
+    """
+    Returns a proxy auto-config script sending the requests to hosts to a
+    closed port, so they fail at once, and every other request direct
+    """
+    conditions = ' || '.join('dnsDomainIs(host, "%s")' % host
+                             for host in hosts)
+    return ('function FindProxyForURL(url, host) { '
+            'if (%s) { return "PROXY 127.0.0.1:9"; } '
+            'return "DIRECT"; }' % conditions)
+
+
+class CachedStaticFilesHandler(StaticFilesHandler):
+    """
+    Static files handler of the live server keeping the assets it served in
+    memory, shared by all test classes of the process.
+
+    - Assets are read from the storage once and sent with a long max-age,
+      so the browser does not request them again during its session
+    - Blocked assets get an empty response without touching the storage
+    """
+
+    cache = {}
+
+    def serve(self, request):
+        if is_blocked_path(request.path):
+            return HttpResponse(status=204)
+        if not cache_enabled():
+            return super(CachedStaticFilesHandler, self).serve(request)
+
+        cached = self.cache.get(request.path)
+        if cached is None:
+            response = super(CachedStaticFilesHandler, self).serve(request)
+            if response.status_code != 200:
+                return response
+            if response.streaming:
+                content = b''.join(response.streaming_content)
+                response.close()
+            else:
+                content = response.content
+            cached = (content, response['Content-Type'])
+            self.cache[request.path] = cached
+
+        content, content_type = cached
+        response = HttpResponse(content, content_type=content_type)
+        response['Cache-Control'] = 'public, max-age=%d' % CACHE_MAX_AGE
+        return response
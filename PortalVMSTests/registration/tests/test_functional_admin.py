@@ -1,8 +1,8 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
+from pom.driverPool import driver_pool
 from pom.pages.adminRegistrationPage import AdminRegistrationPage
 from pom.pageUrls import PageUrls
 import re
@@ -13,7 +13,7 @@ from administrator.models import Administrator
 
 from shift.utils import create_organization, create_country
 
-class SignUpAdmin(LiveServerTestCase):
+class SignUpAdmin(BaseLiveServerTestCase):
     '''
     SignUpAdmin Class contains tests to register a admin User
     Tests included.
@@ -47,12 +47,12 @@ class SignUpAdmin(LiveServerTestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Firefox()
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         super(SignUpAdmin, cls).setUpClass()
         cls.page = AdminRegistrationPage(cls.driver)
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # create an org prior to registration. Bug in Code
         # added to pass CI
         create_organization()
@@ -65,7 +65,7 @@ class SignUpAdmin(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(SignUpAdmin, cls).tearDownClass()
 
     def verify_field_values(self, info):
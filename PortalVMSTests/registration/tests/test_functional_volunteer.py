@@ -1,8 +1,8 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
+from pom.driverPool import driver_pool
 from pom.pages.volunteerRegistrationPage import VolunteerRegistrationPage
 from pom.pageUrls import PageUrls
 import re
@@ -12,7 +12,7 @@ from django.contrib.auth.models import User
 from volunteer.models import Volunteer
 from shift.utils import create_organization, create_country
 
-class SignUpVolunteer(LiveServerTestCase):
+class SignUpVolunteer(BaseLiveServerTestCase):
     '''
     SignUpVolunteer Class contains tests to register volunteer User
     Tests included.
@@ -45,12 +45,12 @@ class SignUpVolunteer(LiveServerTestCase):
     '''
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Firefox()
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.page = VolunteerRegistrationPage(cls.driver)
         super(SignUpVolunteer, cls).setUpClass()
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # create an org prior to registration. Bug in Code
         # added to pass CI
         create_organization()
@@ -63,7 +63,7 @@ class SignUpVolunteer(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(SignUpVolunteer, cls).tearDownClass()
 
     def verify_field_values(self, info):
@@ -0,0 +1,286 @@
+import functools
+import json
+import math
+import os
+import time
+
+from django.db import connection, transaction
+from django.db.models.query import QuerySet
+from django.test.utils import CaptureQueriesContext
+
+# Contains the measuring and baseline helpers of the benchmark suites and
+# the query budgets of the service tests
+
+# Calls per measure, the best time of them is kept
+REPEAT = int(os.environ.get('VMS_BENCHMARK_REPEAT', 3))
+
+# Slowdown over the baseline time tolerated before reporting a regression
+TOLERANCE = float(os.environ.get('VMS_BENCHMARK_TOLERANCE', 0.5))
+
+# Growth of the exponent of time or queries against the dataset size
+# tolerated over the baseline, and the exponent of time taken as nonlinear
+EXPONENT_TOLERANCE = 0.3
+NONLINEAR_EXPONENT = 1.3
+
+def get_sizes(default):
+    """
+    Returns the dataset sizes of VMS_BENCHMARK_SIZES, or default
+    """
+    sizes = os.environ.get('VMS_BENCHMARK_SIZES', default)
+    return [int(size) for size in sizes.split(',')]
+
+def evaluate(result):
+    """
+    Fetches the rows of a queryset result, which is returned cached
+    """
+    if isinstance(result, QuerySet):
+        len(result)
+    return result
+
+def measure(function, *args):
+    """
+    - Calls function REPEAT times and returns its result with the best
+      wall clock time in seconds and the queries of one call
+    - Querysets are evaluated, so their queries are counted
+    """
+    best = None
+    for _ in range(REPEAT):
+        with CaptureQueriesContext(connection) as context:
+            start = time.time()
+            result = evaluate(function(*args))
+            duration = time.time() - start
+        best = duration if best is None else min(best, duration)
+    return result, {'seconds': best, 'queries': len(context.captured_queries)}
+
+def format_queries(queries):
+    return '\n'.join('  %d. %s' % (number, sql)
+                     for number, sql in enumerate(queries, 1))
+
+def get_exponent(measures, metric):
+    """
+    Returns the exponent k of metric ~ size ** k between the smallest and
+    largest size, 0 for constant and 1 for linear growth
+    """
+    sizes = sorted(int(size) for size in measures)
+    if len(sizes) < 2:
+        return 0.0
+    first = measures[str(sizes[0])][metric]
+    last = measures[str(sizes[-1])][metric]
+    if first <= 0 or last <= 0:
+        return 0.0
+    return math.log(float(last) / first) / math.log(float(sizes[-1]) / sizes[0])
+
+
+class BenchmarkRecorder(object):
+    """
+    Records measures of functions at several dataset sizes and compares
+    them to baselines.
+
+    - `record` keeps the time and queries of a function at a size
+    - `regressions` lists the functions running more queries than their
+      baseline, or slower than their timing baseline, or whose time or
+      queries grow faster with the size than they used to or than expected
+    - `save` writes the baselines, of all functions or only of the ones
+      without any yet
+
+    Query counts do not depend on the machine, their baselines are saved in
+    the json file of the repository at `baseline_path`. Times do, so their
+    baselines are only kept in the local file at `timings_path`, if any.
+    """
+
+    def __init__(self, baseline_path, timings_path=None):
+        self.baseline_path = baseline_path
+        self.timings_path = timings_path
+        self.measures = {}
+        self.expected_query_exponents = {}
+        self.baselines = self.load(baseline_path)
+        self.timings = self.load(timings_path)
+
+    @staticmethod
+    def load(path):
+        if not path or not os.path.exists(path):
+            return {}
+        with open(path) as baseline_file:
+            return json.load(baseline_file)
+
+    @staticmethod
+    def dump(summary, path):
+        with open(path, 'w') as baseline_file:
+            json.dump(summary, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write('\n')
+
+    def record(self, name, size, measures):
+        self.measures.setdefault(name, {})[str(size)] = measures
+
+    def expect_query_growth(self, name, exponent):
+        """
+        Declares how the queries of a function grow with the dataset size,
+        0 (the default) for a constant number of queries
+        """
+        self.expected_query_exponents[name] = exponent
+
+    def summary(self):
+        summary = {}
+        for name, measures in self.measures.items():
+            summary[name] = {
+                'measures': measures,
+                'time_exponent': get_exponent(measures, 'seconds'),
+                'query_exponent': get_exponent(measures, 'queries'),
+                }
+        return summary
+
+    def regressions(self):
+        regressions = []
+        for name, result in sorted(self.summary().items()):
+            expected = self.expected_query_exponents.get(name, 0)
+            if result['query_exponent'] > expected + EXPONENT_TOLERANCE:
+                regressions.append(
+                    '%s: queries grow as size ** %.2f, expected ** %s' % (
+                        name, result['query_exponent'], expected))
+            if result['time_exponent'] > NONLINEAR_EXPONENT:
+                regressions.append('%s: time grows as size ** %.2f' % (
+                    name, result['time_exponent']))
+
+            baseline = self.baselines.get(name)
+            if baseline:
+                for size, measures in sorted(result['measures'].items()):
+                    base = baseline['measures'].get(size)
+                    if base and measures['queries'] > base['queries']:
+                        regressions.append(
+                            '%s at %s: %d queries, baseline %d' % (
+                                name, size, measures['queries'],
+                                base['queries']))
+                if result['query_exponent'] > \
+                        baseline['query_exponent'] + EXPONENT_TOLERANCE:
+                    regressions.append('%s: query_exponent %.2f, '
+                                       'baseline %.2f' % (
+                                           name, result['query_exponent'],
+                                           baseline['query_exponent']))
+
+            timing = self.timings.get(name)
+            if timing:
+                for size, measures in sorted(result['measures'].items()):
+                    base = timing['measures'].get(size)
+                    if not base:
+                        continue
+                    if measures['seconds'] > base['seconds'] * (1 + TOLERANCE):
+                        regressions.append(
+                            '%s at %s: %.4fs, baseline %.4fs' % (
+                                name, size, measures['seconds'],
+                                base['seconds']))
+                if result['time_exponent'] > \
+                        timing['time_exponent'] + EXPONENT_TOLERANCE:
+                    regressions.append('%s: time_exponent %.2f, '
+                                       'baseline %.2f' % (
+                                           name, result['time_exponent'],
+                                           timing['time_exponent']))
+        return regressions
+
+    def missing_baselines(self):
+        """
+        Returns the names of the recorded functions without a query baseline
+        """
+        return sorted(name for name in self.measures
+                      if name not in self.baselines)
+
+    def save(self, names=None):
+        """
+        Saves the query counts of the passed functions, all by default, to
+        the baselines of the repository and their times to the local
+        timings file, if any
+        """
+        summary = self.summary()
+        for name in summary if names is None else names:
+            result = summary[name]
+            self.baselines[name] = {
+                'measures': dict((size, {'queries': measures['queries']})
+                                 for size, measures
+                                 in result['measures'].items()),
+                'query_exponent': result['query_exponent'],
+                }
+            self.timings[name] = {
+                'measures': dict((size, {'seconds': measures['seconds']})
+                                 for size, measures
+                                 in result['measures'].items()),
+                'time_exponent': result['time_exponent'],
+                }
+        self.dump(self.baselines, self.baseline_path)
+        if self.timings_path:
+            self.dump(self.timings, self.timings_path)
+
+    def report(self):
+        lines = []
+        for name, result in sorted(self.summary().items()):
+            for size, measures in sorted(result['measures'].items(),
+                                         key=lambda item: int(item[0])):
+                lines.append('%-40s %8s %10.4fs %6d queries' % (
+                    name, size, measures['seconds'], measures['queries']))
+        return '\n'.join(lines)
+
+
+class QueryBudget(object):
+    """
+    Fails with an AssertionError listing the queries run when a block or a
+    function runs more queries than its budget.
+
+    - As a context manager, counts the queries of the block
+    - As a decorator, counts the queries of every call of the function,
+      querysets it returns are evaluated inside the budget
+    - `calls` keeps the number and text of the queries of every call
+    """
+
+    def __init__(self, budget, label='block'):
+        self.budget = budget
+        self.label = label
+        self.calls = []
+        self.queries = []
+
+    def __enter__(self):
+        self.context = CaptureQueriesContext(connection)
+        self.context.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.context.__exit__(exc_type, exc_value, traceback)
+        self.queries = [query['sql'] for query in self.context.captured_queries]
+        self.calls.append(self.queries)
+        if exc_type is None and self.budget is not None and \
+                len(self.queries) > self.budget:
+            raise AssertionError('%s ran %d queries, budget %d:\n%s' % (
+                self.label, len(self.queries), self.budget,
+                format_queries(self.queries)))
+
+    def __call__(self, function):
+        budget = QueryBudget(self.budget, function.__name__)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with budget:
+                return evaluate(function(*args, **kwargs))
+        wrapper.query_budget = budget
+        return wrapper
+
+
+def assert_constant_queries(function, build_args, sizes=(1, 10)):
+    """
+    - Calls function with the arguments build_args returns for every size,
+      build_args can also create the rows the call should go through
+    - Fails when the queries of the call grow with the size, for ex. with
+      N+1 queries, the rows created are rolled back
+    """
+    counts = []
+    with transaction.atomic():
+        for size in sizes:
+            args = build_args(size)
+            with QueryBudget(None, function.__name__) as budget:
+                evaluate(function(*args))
+            counts.append((size, budget.queries))
+        transaction.set_rollback(True)
+
+    first_size, first_queries = counts[0]
+    for size, queries in counts[1:]:
+        if len(queries) > len(first_queries):
+            raise AssertionError(
+                '%s ran %d queries at size %d and %d at size %d:\n%s' % (
+                    function.__name__, len(first_queries), first_size,
+                    len(queries), size, format_queries(queries)))
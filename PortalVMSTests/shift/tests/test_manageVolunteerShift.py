@@ -1,10 +1,10 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
+from pom.driverPool import driver_pool
 from pom.pages.eventSignUpPage import EventSignUpPage
 from pom.pages.authenticationPage import AuthenticationPage
 from pom.pages.manageShiftPage import ManageShiftPage
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
 from shift.models import VolunteerShift, Shift
@@ -16,7 +16,7 @@ from shift.utils import (
     create_shift_with_details
     )
 
-class ManageVolunteerShift(LiveServerTestCase):
+class ManageVolunteerShift(BaseLiveServerTestCase):
     '''
     Admin users have ManageVolunteerShift View which has the following
     functionalities:
@@ -43,6 +43,8 @@ class ManageVolunteerShift(LiveServerTestCase):
     - Test if a shift can be assigned to a volunteer who has already been
       assigned the same shift
     '''
+    credentials = {'username': 'admin', 'password': 'admin'}
+
     @classmethod
     def setUpClass(cls):
 
@@ -53,30 +55,24 @@ class ManageVolunteerShift(LiveServerTestCase):
                 'volunteer-two', 'volunteer-two', 'volunteer-two', 'volunteer-two',
                 '9999999999', 'volunteer-email2@systers.org', 'volunteer-two']
 
-        cls.driver = webdriver.Firefox()
-        cls.driver.implicitly_wait(5)
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.sign_up_page = EventSignUpPage(cls.driver)
         cls.manage_shift_page = ManageShiftPage(cls.driver)
         cls.authentication_page = AuthenticationPage(cls.driver)
         super(ManageVolunteerShift, cls).setUpClass()
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         create_admin()
-        self.login_admin()
 
     def tearDown(self):
         pass
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(ManageVolunteerShift, cls).tearDownClass()
 
-    def login_admin(self):
-        self.authentication_page.server_url = self.live_server_url
-        self.authentication_page.login({ 'username' : 'admin', 'password' : 'admin'})
-
     def create_shift(self, shift):
         # register event to create job
         event = ['event-name', '2017-05-20', '2017-05-20']
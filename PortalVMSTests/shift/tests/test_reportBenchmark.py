@@ -0,0 +1,66 @@
+import json
+import os
+import unittest
+
+from shift.benchmark import get_sizes, measure
+from shift.services import (
+            calculate_total_report_hours,
+            generate_report,
+            get_administrator_report,
+            get_volunteer_report
+            )
+from shift.utils import (
+        begin_module_transaction,
+        clear_objects,
+        create_scaled_dataset
+        )
+
+
+@unittest.skipUnless(os.environ.get('VMS_TEST_BENCHMARK'),
+                     'set VMS_TEST_BENCHMARK=1 to run the benchmarks')
+class ReportBenchmark(unittest.TestCase):
+    '''
+    Times the report functions of shift.services on datasets of
+    create_scaled_dataset at every size of VMS_BENCHMARK_SIZES. Timings
+    are printed and, with VMS_BENCHMARK_REPORT set, saved as json.
+    '''
+
+    def time_reports(self, size):
+        dataset = create_scaled_dataset(size)
+        volunteer = dataset['volunteers'][0]
+        logged_shifts = [volunteer_shift for volunteer_shift
+                         in dataset['volunteer_shifts']
+                         if volunteer_shift.start_time is not None]
+
+        measures = {}
+        report, measures['get_administrator_report'] = measure(
+            get_administrator_report, '', '', '', '', '', '', '')
+        self.assertIsNotNone(report)
+        report, measures['get_volunteer_report'] = measure(
+            get_volunteer_report, volunteer.id, '', '', '', '')
+        self.assertIsNotNone(report)
+        report, measures['generate_report'] = measure(
+            generate_report, logged_shifts)
+        self.assertEqual(len(report), len(logged_shifts))
+        total, measures['calculate_total_report_hours'] = measure(
+            calculate_total_report_hours, report)
+        self.assertIsNotNone(total)
+        return measures
+
+    def test_report_functions(self):
+        results = []
+        for size in get_sizes('1000,10000,100000'):
+            begin_module_transaction()
+            try:
+                measures = self.time_reports(size)
+            finally:
+                clear_objects()
+            for function, result in sorted(measures.items()):
+                results.append(dict(result, function=function, size=size))
+                print('%-32s %8d %10.4fs %6d queries' % (
+                    function, size, result['seconds'], result['queries']))
+
+        report = os.environ.get('VMS_BENCHMARK_REPORT')
+        if report:
+            with open(report, 'w') as report_file:
+                json.dump(results, report_file, indent=2)
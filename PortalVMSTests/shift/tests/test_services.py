@@ -3,6 +3,7 @@ from datetime import date, timedelta
 from django.core.exceptions import ObjectDoesNotExist
 import unittest
 
+from shift.benchmark import QueryBudget, assert_constant_queries
 from shift.models import VolunteerShift
 from shift.utils import *
 
@@ -31,31 +32,50 @@ from shift.services import (
             get_administrator_report
             )
 
-def setUpModule():
+# Most queries each call of these services may run
+get_shift_by_id = QueryBudget(1)(get_shift_by_id)
+get_shifts_by_job_id = QueryBudget(1)(get_shifts_by_job_id)
+get_shifts_ordered_by_date = QueryBudget(1)(get_shifts_ordered_by_date)
+get_shift_slots_remaining = QueryBudget(2)(get_shift_slots_remaining)
+get_volunteer_shift_by_id = QueryBudget(1)(get_volunteer_shift_by_id)
+get_volunteers_by_shift_id = QueryBudget(1)(get_volunteers_by_shift_id)
+get_logged_volunteers_by_shift_id = QueryBudget(1)(
+    get_logged_volunteers_by_shift_id)
+is_signed_up = QueryBudget(1)(is_signed_up)
+
+def build_dataset():
     """
     - Creates objects which can be reused by multiple test classes
     - Creates shifts with limited slots and with multiple slots for use
     """
 
-    global e1
-    global j1,j2
-    global s1,s2,s3
-
     event_1 = ["Open Source Event","2012-9-1","2012-11-23"]
     e1 = create_event_with_details(event_1)
 
     job_1 = ["Software Developer","2012-10-22","2012-10-30","A software job",e1]
     job_2 = ["Systems Administrator","2012-9-1","2012-10-26","A systems administrator job",e1]
-    j1 = create_job_with_details(job_1)
-    j2 = create_job_with_details(job_2)
+    j1, j2 = create_jobs_in_bulk([job_1, job_2])
 
     shift_1 = ["2012-10-28","9:00","15:00",1,j1]
     shift_2 = ["2012-10-25","10:00","16:00",2,j1]
     shift_3 = ["2012-10-22","10:00","16:00",4,j2]
 
-    s1 = create_shift_with_details(shift_1)
-    s2 = create_shift_with_details(shift_2)
-    s3 = create_shift_with_details(shift_3)
+    s1, s2, s3 = create_shifts_in_bulk([shift_1, shift_2, shift_3])
+    return [e1, j1, j2, s1, s2, s3]
+
+def setUpModule():
+    """
+    Restores the dataset of build_dataset from its snapshot, building it
+    on the first run
+    """
+
+    begin_module_transaction()
+
+    global e1
+    global j1,j2
+    global s1,s2,s3
+
+    e1, j1, j2, s1, s2, s3 = seed_dataset('shift_services', build_dataset)
 
 def tearDownModule():
     # Destroys all objects created
@@ -760,6 +780,22 @@ class ShiftWithVolunteerTest(unittest.TestCase):
         self.assertEqual(volunteer_list_for_shift_3[1], self.v2)
         self.assertEqual(volunteer_list_for_shift_3[2], self.v1)
 
+    def test_get_volunteers_by_shift_id_queries(self):
+        """ Test queries of get_volunteers_by_shift_id(s_id) do not grow """
+
+        def build_args(size):
+            volunteers = create_volunteers_in_bulk(
+                [["volunteer-%d-%d" % (size, index), "First", "Last",
+                  "address", "city", "state", "country", "9999999999",
+                  "volunteer-%d-%d@volunteer.com" % (size, index)]
+                 for index in range(size)])
+            bulk_create_objects(VolunteerShift, [
+                VolunteerShift(volunteer=volunteer, shift=self.s3)
+                for volunteer in volunteers])
+            return (self.s3.id,)
+
+        assert_constant_queries(get_volunteers_by_shift_id, build_args)
+
     def test_get_logged_volunteers_by_shift_id(self):
         """ Uses volunteers v1,v2,v3 and shift s3 """
 
@@ -0,0 +1,116 @@
+import datetime
+import os
+import unittest
+
+from shift.benchmark import BenchmarkRecorder, get_sizes, measure
+from shift.services import (
+            calculate_total_report_hours,
+            generate_report,
+            get_all_volunteer_shifts_with_hours,
+            get_shift_slots_remaining,
+            get_shifts_with_open_slots,
+            get_volunteer_shifts_with_hours
+            )
+from shift.models import VolunteerShift
+from shift.utils import (
+        begin_module_transaction,
+        bulk_create_objects,
+        clear_objects,
+        create_jobs_in_bulk,
+        create_scaled_dataset,
+        create_shifts_in_bulk
+        )
+
+BASELINES = os.path.join(os.path.dirname(__file__), 'benchmark_baselines.json')
+# timings depend on the machine, so their baselines are kept in a local file
+TIMINGS = os.environ.get('VMS_BENCHMARK_TIMINGS')
+
+
+@unittest.skipUnless(os.environ.get('VMS_TEST_BENCHMARK'),
+                     'set VMS_TEST_BENCHMARK=1 to run the benchmarks')
+class ServicesBenchmark(unittest.TestCase):
+    '''
+    Measures the time and queries of the most called shift.services
+    functions on datasets of create_scaled_dataset at every size of
+    VMS_BENCHMARK_SIZES (1k, 5k and 20k volunteer shifts by default).
+    Open slots are read from a job whose shifts and registrations grow
+    with the dataset.
+
+    Fails when a function runs more queries than its baseline in
+    benchmark_baselines.json, is slower than its baseline in the local
+    VMS_BENCHMARK_TIMINGS file, or when its queries or time grow faster
+    with the dataset than expected, for ex. with N+1 queries. A passing
+    run saves the baselines of the functions without any, run with
+    VMS_BENCHMARK_UPDATE=1 to replace them all after an intended change.
+    '''
+
+    def create_growing_job(self, dataset, size):
+        '''
+        Adds a job with a shift per 50 volunteer shifts of the dataset and
+        registers every volunteer for its first shift. The jobs and shifts
+        of the dataset keep the same number of shifts and registrations at
+        every size, so they can not show how the services scale with them.
+        '''
+        event = dataset['events'][0]
+        job = create_jobs_in_bulk([[
+            'job-growing', event.start_date, event.end_date,
+            'job growing with the dataset', event]])[0]
+        volunteers = dataset['volunteers']
+        shifts = create_shifts_in_bulk([
+            [event.start_date, datetime.time(9), datetime.time(12),
+             len(volunteers) + 1, job]
+            for _ in range(max(1, size // 50))])
+        bulk_create_objects(VolunteerShift, [
+            VolunteerShift(volunteer=volunteer, shift=shifts[0])
+            for volunteer in volunteers])
+        return job, shifts[0]
+
+    def measure_services(self, recorder, size):
+        dataset = create_scaled_dataset(size)
+        job, shift = self.create_growing_job(dataset, size)
+        volunteer = dataset['volunteers'][0]
+        logged_shifts = [volunteer_shift for volunteer_shift
+                         in dataset['volunteer_shifts']
+                         if volunteer_shift.start_time is not None]
+
+        calls = [
+            ('get_shifts_with_open_slots', get_shifts_with_open_slots,
+             (job.id,)),
+            ('get_shift_slots_remaining', get_shift_slots_remaining,
+             (shift.id,)),
+            ('get_volunteer_shifts_with_hours',
+             get_volunteer_shifts_with_hours, (volunteer,)),
+            ('get_all_volunteer_shifts_with_hours',
+             get_all_volunteer_shifts_with_hours, ()),
+            ('generate_report', generate_report, (logged_shifts,)),
+            ]
+        for name, function, args in calls:
+            result, measures = measure(function, *args)
+            recorder.record(name, size, measures)
+            if name == 'generate_report':
+                report = result
+
+        result, measures = measure(calculate_total_report_hours, report)
+        recorder.record('calculate_total_report_hours', size, measures)
+
+    def test_services(self):
+        recorder = BenchmarkRecorder(BASELINES, TIMINGS)
+        # reports follow the relations of each passed volunteer shift
+        recorder.expect_query_growth('generate_report', 1)
+
+        for size in get_sizes('1000,5000,20000'):
+            begin_module_transaction()
+            try:
+                self.measure_services(recorder, size)
+            finally:
+                clear_objects()
+
+        print(recorder.report())
+        if os.environ.get('VMS_BENCHMARK_UPDATE'):
+            recorder.save()
+            return
+        regressions = recorder.regressions()
+        if not regressions and recorder.missing_baselines():
+            # the first run of a function records its baselines
+            recorder.save(recorder.missing_baselines())
+        self.assertEqual(regressions, [], '\n'.join(regressions))
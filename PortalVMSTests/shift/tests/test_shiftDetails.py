@@ -1,6 +1,7 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 from shift.models import VolunteerShift
 
+from pom.driverPool import driver_pool
 from pom.pages.shiftDetailsPage import ShiftDetailsPage
 from pom.pages.authenticationPage import AuthenticationPage
 
@@ -14,11 +15,10 @@ from shift.utils import (
     register_volunteer_for_shift_utility
     )
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
 
-class ShiftDetails(LiveServerTestCase):
+class ShiftDetails(BaseLiveServerTestCase):
     '''
     Contains Tests for View Shift Details Page
 
@@ -28,22 +28,24 @@ class ShiftDetails(LiveServerTestCase):
     - Volunteer with logged shift hours
     '''
 
+    credentials = {'username': 'admin', 'password': 'admin'}
+
     @classmethod
     def setUpClass(cls):
         cls.volunteer_detail = ['volunteer-usernameq', 'Michael', 'Reed',
                 'address', 'city', 'state', 'country', '9999999999',
                 'volunteer@volunteer.com', 'organization']
 
-        cls.driver = webdriver.Firefox()
-        cls.driver.implicitly_wait(5)
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.shift_details_page = ShiftDetailsPage(cls.driver)
         cls.authentication_page = AuthenticationPage(cls.driver)
         super(ShiftDetails, cls).setUpClass()
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = create_admin()
+
     def setUp(self):
-        self.admin = create_admin()
-        self.login_admin()
         self.shift = self.register_dataset()
 
     def tearDown(self):
@@ -51,14 +53,9 @@ class ShiftDetails(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(ShiftDetails, cls).tearDownClass()
 
-    def login_admin(self):
-        authentication_page = self.authentication_page
-        authentication_page.server_url = self.live_server_url
-        authentication_page.login({'username': 'admin', 'password': 'admin'})
-
     def register_dataset(self):
         e1 = create_event_with_details(['event', '2017-06-15', '2017-06-17'])
         j1 = create_job_with_details(['job', '2017-06-15', '2017-06-15', 'job description', e1])
@@ -1,8 +1,8 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
+from pom.driverPool import driver_pool
 from pom.pages.completedShiftsPage import CompletedShiftsPage
 from pom.pages.authenticationPage import AuthenticationPage
 
@@ -16,15 +16,13 @@ from shift.utils import (
     log_hours_with_details
     )
 
-class ShiftHours(LiveServerTestCase):
+class ShiftHours(BaseLiveServerTestCase):
     '''
     '''
 
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Firefox()
-        cls.driver.implicitly_wait(5)
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.completed_shifts_page = CompletedShiftsPage(cls.driver)
         cls.authentication_page = AuthenticationPage(cls.driver)
         super(ShiftHours, cls).setUpClass()
@@ -38,7 +36,7 @@ class ShiftHours(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(ShiftHours, cls).tearDownClass()
 
     def login_volunteer(self):
@@ -67,12 +65,9 @@ class ShiftHours(LiveServerTestCase):
         completed_shifts_page = self.completed_shifts_page
         completed_shifts_page.go_to_completed_shifts()
 
-        self.assertEqual(completed_shifts_page.get_shift_job(), 'job')
-        self.assertEqual(completed_shifts_page.get_shift_date(), 'June 15, 2017')
-        self.assertEqual(completed_shifts_page.get_shift_start_time(), 'noon')
-        self.assertEqual(completed_shifts_page.get_shift_end_time(), '1 p.m.')
-        self.assertEqual(completed_shifts_page.get_edit_shift_hours(), 'Edit Hours')
-        self.assertEqual(completed_shifts_page.get_clear_shift_hours(), 'Clear Hours')
+        shift = completed_shifts_page.get_shifts()[0]
+        self.assertEqual(shift[:6], ['job', 'June 15, 2017', 'noon', '1 p.m.',
+            'Edit Hours', 'Clear Hours'])
 
     def test_edit_hours(self):
         self.register_dataset()
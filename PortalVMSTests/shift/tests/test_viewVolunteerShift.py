@@ -1,5 +1,6 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
+from pom.driverPool import driver_pool
 from pom.pages.upcomingShiftsPage import UpcomingShiftsPage
 from pom.pages.authenticationPage import AuthenticationPage
 from pom.pages.manageShiftPage import ManageShiftPage
@@ -15,19 +16,16 @@ from shift.utils import (
     register_volunteer_for_shift_utility
     )
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
 import re
 
-class ViewVolunteerShift(LiveServerTestCase):
+class ViewVolunteerShift(BaseLiveServerTestCase):
     '''
     '''
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Firefox()
-        cls.driver.implicitly_wait(5)
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.manage_shift_page = ManageShiftPage(cls.driver)
         cls.upcoming_shift_page = UpcomingShiftsPage(cls.driver)
         cls.authentication_page = AuthenticationPage(cls.driver)
@@ -42,7 +40,7 @@ class ViewVolunteerShift(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(ViewVolunteerShift, cls).tearDownClass()
 
     def login_volunteer(self):
@@ -90,10 +88,9 @@ class ViewVolunteerShift(LiveServerTestCase):
         upcoming_shift_page = self.upcoming_shift_page
         upcoming_shift_page.view_upcoming_shifts()
 
-        self.assertEqual(upcoming_shift_page.get_shift_job(), 'jobOneInEventFour')
-        self.assertEqual(upcoming_shift_page.get_shift_date(), 'June 1, 2017')
-        self.assertEqual(upcoming_shift_page.get_shift_start_time(), '9 a.m.')
-        self.assertEqual(upcoming_shift_page.get_shift_end_time(), '3 p.m.')
+        shift = upcoming_shift_page.get_shifts()[0]
+        self.assertEqual(shift[:4], ['jobOneInEventFour', 'June 1, 2017',
+            '9 a.m.', '3 p.m.'])
 
     def test_log_hours_and_logged_shift_does_not_appear_in_upcoming_shifts(self):
 
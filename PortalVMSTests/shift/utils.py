@@ -1,3 +1,15 @@
+import datetime
+import glob
+import gzip
+import hashlib
+import inspect
+import json
+import os
+import random
+import tempfile
+
+from collections import OrderedDict
+
 from event.models import Event
 from job.models import Job
 from administrator.models import Administrator
@@ -6,15 +18,69 @@ from shift.models import Shift, VolunteerShift
 from volunteer.models import Volunteer
 from organization.models import Organization
 from cities_light.models import Country
+from django.conf import global_settings, settings
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.core import serializers
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.test.utils import override_settings
 
 # Contains common functions which need to be frequently called by tests
 
+# Hashes of the fixture passwords, computed once per process and hasher
+password_hashes = {}
+
+# Keeps Django's default (slow) hashers for tests of the authentication
+# itself, when running with the fast hasher of vms.settings_test
+use_real_password_hasher = override_settings(
+    PASSWORD_HASHERS=global_settings.PASSWORD_HASHERS)
+
+def get_password_hash(password):
+    """
+    Returns the stored hash of a fixture password, hashing it only the first
+    time it is asked for with the current hasher
+    """
+    key = (settings.PASSWORD_HASHERS[0], password)
+    if key not in password_hashes:
+        password_hashes[key] = make_password(password)
+    return password_hashes[key]
+
+def create_user_with_password(username, password):
+    """
+    Creates and returns a user like User.objects.create_user does, reusing
+    the cached hash of the password
+    """
+    return User.objects.create(
+        username = username,
+        password = get_password_hash(password)
+        )
+
+# transactions opened by begin_module_transaction, newest last
+module_atomics = []
+
+def begin_module_transaction():
+    """
+    - Opens a transaction that the next clear_objects call rolls back
+    - Called at the start of setUpModule/setUpClass so the objects created
+      for a module are dropped with one rollback instead of table deletes
+    """
+    atomic = transaction.atomic()
+    atomic.__enter__()
+    module_atomics.append(atomic)
+
 def clear_objects():
     """
-    - Deletes objects from multiple tables
+    - Rolls back the transaction of begin_module_transaction if one is open,
+      else deletes objects from multiple tables
     - Called once all tests in a module are completed
     """
-    
+    if module_atomics:
+        atomic = module_atomics.pop()
+        transaction.set_rollback(True)
+        atomic.__exit__(None, None, None)
+        return
+
     VolunteerShift.objects.all().delete()
     Volunteer.objects.all().delete()
     User.objects.all().delete()
@@ -55,10 +121,7 @@ def create_volunteer_with_details(volunteer):
     """
     Creates and returns volunteer with passed name and dates
     """
-    u1 = User.objects.create_user(
-        username = volunteer[0],
-        password = 'volunteer'
-        )
+    u1 = create_user_with_password(volunteer[0], 'volunteer')
     v1 = Volunteer(
         first_name=volunteer[1],
         last_name=volunteer[2],
@@ -88,6 +151,296 @@ def create_shift_with_details(shift):
     s1.save()
     return s1
 
+def bulk_create_objects(model, objects):
+    """
+    - Inserts all passed objects of a model with a single query
+    - Returns the created objects with their primary keys set
+    """
+    created = model.objects.bulk_create(objects)
+    if objects and created[0].pk is None:
+        # backend did not return the ids, the new rows are the last ones
+        created = list(model.objects.order_by('-pk')[:len(objects)])[::-1]
+    return created
+
+def create_events_in_bulk(events):
+    """
+    Creates and returns events for a list of (name, start, end) entries,
+    as passed to create_event_with_details
+    """
+    return bulk_create_objects(Event, [
+        Event(
+            name=event[0],
+            start_date=event[1],
+            end_date=event[2]
+            )
+        for event in events])
+
+def create_jobs_in_bulk(jobs):
+    """
+    Creates and returns jobs for a list of entries as passed to
+    create_job_with_details
+    """
+    return bulk_create_objects(Job, [
+        Job(
+            name=job[0],
+            start_date=job[1],
+            end_date=job[2],
+            description=job[3],
+            event=job[4]
+            )
+        for job in jobs])
+
+def create_shifts_in_bulk(shifts):
+    """
+    Creates and returns shifts for a list of entries as passed to
+    create_shift_with_details
+    """
+    return bulk_create_objects(Shift, [
+        Shift(
+            date=shift[0],
+            start_time=shift[1],
+            end_time=shift[2],
+            max_volunteers=shift[3],
+            job=shift[4]
+            )
+        for shift in shifts])
+
+def create_volunteers_in_bulk(volunteers):
+    """
+    - Creates and returns volunteers for a list of entries as passed to
+      create_volunteer_with_details
+    - Users get the 'volunteer' password, hashed once for all of them
+    """
+    password = get_password_hash('volunteer')
+    users = bulk_create_objects(User, [
+        User(username=volunteer[0], password=password)
+        for volunteer in volunteers])
+
+    return bulk_create_objects(Volunteer, [
+        Volunteer(
+            first_name=volunteer[1],
+            last_name=volunteer[2],
+            address=volunteer[3],
+            city=volunteer[4],
+            state=volunteer[5],
+            country=volunteer[6],
+            phone_number=volunteer[7],
+            email=volunteer[8],
+            user=user
+            )
+        for volunteer, user in zip(volunteers, users)])
+
+def pick_skewed(rng, items, skew=2):
+    """
+    Picks an item with the first items picked most often, like the few
+    volunteers signing up for most of the shifts
+    """
+    return items[int(len(items) * rng.random() ** skew)]
+
+def create_scaled_dataset(volunteer_shifts, seed=0):
+    """
+    - Creates a synthetic dataset sized by its number of volunteer shifts,
+      with a volunteer per 10, a shift per 5, a job per 10 shifts, an event
+      per 5 jobs and an organization per 50 volunteers
+    - Events span 1 to 3 weeks of 2017, shifts of 2 to 6 hours start
+      between 8:00 and 14:00 on a day of their job, a few volunteers take
+      most shifts and 80% of the volunteer shifts have logged hours
+    - The same seed always creates the same dataset
+    - Returns a dict of the created objects by plural model name
+    """
+    rng = random.Random(seed)
+    count_shifts = max(1, volunteer_shifts // 5)
+    count_volunteers = max(1, volunteer_shifts // 10)
+    count_jobs = max(1, count_shifts // 10)
+    count_events = max(1, count_jobs // 5)
+    count_organizations = max(1, count_volunteers // 50)
+
+    organizations = bulk_create_objects(Organization, [
+        Organization(name='organization-%d' % index)
+        for index in range(count_organizations)])
+
+    events = []
+    for index in range(count_events):
+        start = datetime.date(2017, 1, 1) + datetime.timedelta(
+            days=rng.randint(0, 330))
+        end = start + datetime.timedelta(days=rng.randint(7, 21))
+        events.append(['event-%d' % index, start, end])
+    events = create_events_in_bulk(events)
+
+    jobs = []
+    for index in range(count_jobs):
+        event = events[index % count_events]
+        jobs.append(['job-%d' % index, event.start_date, event.end_date,
+                     'job %d of %s' % (index, event.name), event])
+    jobs = create_jobs_in_bulk(jobs)
+
+    shifts = []
+    for index in range(count_shifts):
+        job = jobs[index % count_jobs]
+        date = job.start_date + datetime.timedelta(
+            days=rng.randint(0, (job.end_date - job.start_date).days))
+        start_hour = rng.randint(8, 14)
+        end_hour = start_hour + rng.randint(2, 6)
+        shifts.append([date, datetime.time(start_hour), datetime.time(end_hour),
+                       rng.randint(1, 10), job])
+    shifts = create_shifts_in_bulk(shifts)
+
+    volunteers = create_volunteers_in_bulk([
+        ['volunteer-%d' % index, 'First%d' % index, 'Last%d' % index,
+         '%d Main Street' % index, 'city-%d' % (index % 20),
+         'state-%d' % (index % 5), 'country-%d' % (index % 3),
+         '%010d' % index, 'volunteer%d@example.com' % index]
+        for index in range(count_volunteers)])
+    members = dict((organization.pk, []) for organization in organizations)
+    for volunteer in volunteers:
+        volunteer.organization = pick_skewed(rng, organizations)
+        members[volunteer.organization.pk].append(volunteer.pk)
+    for organization_id, volunteer_ids in members.items():
+        # in chunks, sqlite limits the number of query parameters
+        for index in range(0, len(volunteer_ids), 500):
+            Volunteer.objects.filter(
+                pk__in=volunteer_ids[index:index + 500]).update(
+                organization=organization_id)
+
+    pairs = set()
+    registrations = []
+    while len(registrations) < volunteer_shifts and \
+            len(pairs) < count_volunteers * count_shifts:
+        volunteer = pick_skewed(rng, volunteers)
+        shift = shifts[rng.randrange(count_shifts)]
+        if (volunteer.pk, shift.pk) in pairs:
+            continue
+        pairs.add((volunteer.pk, shift.pk))
+        logged = rng.random() < 0.8
+        registrations.append(VolunteerShift(
+            volunteer=volunteer,
+            shift=shift,
+            start_time=shift.start_time if logged else None,
+            end_time=shift.end_time if logged else None
+            ))
+    registrations = bulk_create_objects(VolunteerShift, registrations)
+
+    return {
+        'organizations': organizations,
+        'events': events,
+        'jobs': jobs,
+        'shifts': shifts,
+        'volunteers': volunteers,
+        'volunteer_shifts': registrations,
+        }
+
+# Models saved in dataset snapshots, parents before children
+seed_models = [User, Organization, Volunteer, Event, Job, Shift, VolunteerShift]
+
+# Folder of the dataset snapshots written by seed_dataset
+seed_dir = os.environ.get(
+    'VMS_TEST_SEED_DIR',
+    os.path.join(tempfile.gettempdir(), 'vms_test_seeds'))
+
+def get_model_label(model):
+    return '%s.%s' % (model._meta.app_label, model._meta.model_name)
+
+def get_last_pk(model):
+    return model.objects.order_by('-pk').values_list(
+        'pk', flat=True).first() or 0
+
+def get_seed_key(name, builder):
+    """
+    Returns the snapshot name of a dataset, which changes with the database
+    engine, any migration of an installed app or the source of the builder
+    """
+    digest = hashlib.sha1(connection.vendor.encode('utf-8'))
+    for app_config in sorted(apps.get_app_configs(), key=lambda c: c.label):
+        pattern = os.path.join(app_config.path, 'migrations', '*.py')
+        for path in sorted(glob.glob(pattern)):
+            with open(path, 'rb') as migration:
+                digest.update(migration.read())
+    try:
+        digest.update(inspect.getsource(builder).encode('utf-8'))
+    except (IOError, TypeError):
+        pass
+    return '%s-%s' % (name, digest.hexdigest()[:16])
+
+def save_snapshot(path, objects, last_pks):
+    """
+    Writes the rows created since last_pks and the labels and pks of the
+    objects returned by the builder to path
+    """
+    rows = []
+    for model in seed_models:
+        rows.extend(model.objects.filter(
+            pk__gt=last_pks[model]).order_by('pk'))
+    snapshot = {
+        'last_pks': dict(
+            (get_model_label(model), pk) for model, pk in last_pks.items()),
+        'rows': json.loads(serializers.serialize('json', rows)),
+        'objects': [[get_model_label(type(obj)), obj.pk] for obj in objects],
+        }
+    if not os.path.isdir(seed_dir):
+        os.makedirs(seed_dir)
+    temp_path = '%s.%d' % (path, os.getpid())
+    with gzip.open(temp_path, 'wb') as snapshot_file:
+        snapshot_file.write(json.dumps(snapshot).encode('utf-8'))
+    os.rename(temp_path, path)
+
+def restore_snapshot(path, last_pks):
+    """
+    - Inserts the rows of a snapshot with one bulk insert per model and
+      returns the objects of the dataset
+    - Returns None without inserting anything if rows were created since
+      the snapshot was taken, as their pks could clash
+    """
+    with gzip.open(path, 'rb') as snapshot_file:
+        snapshot = json.loads(snapshot_file.read().decode('utf-8'))
+    for model, pk in last_pks.items():
+        if pk > snapshot['last_pks'].get(get_model_label(model), 0):
+            return None
+
+    rows = OrderedDict((model, []) for model in seed_models)
+    for row in serializers.deserialize('python', snapshot['rows']):
+        rows[type(row.object)].append(row)
+    for model, model_rows in rows.items():
+        if model_rows:
+            model.objects.bulk_create([row.object for row in model_rows])
+    for model_rows in rows.values():
+        for row in model_rows:
+            for field_name, values in row.m2m_data.items():
+                getattr(row.object, field_name).add(*values)
+
+    # rows were inserted with their pks, move the sequences past them
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), seed_models):
+            cursor.execute(sql)
+
+    objects = []
+    for label, pk in snapshot['objects']:
+        objects.append(apps.get_model(label).objects.get(pk=pk))
+    return objects
+
+def seed_dataset(name, builder):
+    """
+    - Returns the objects of a named dataset. builder creates the dataset
+      and returns its objects as a list
+    - The first run saves the created rows to a compressed snapshot in
+      VMS_TEST_SEED_DIR, later runs restore it instead of calling builder
+    - Snapshots are keyed by the migrations and the builder's source, so
+      they are rebuilt whenever either changes. Set VMS_TEST_SEEDS=off to
+      always call builder
+    """
+    if os.environ.get('VMS_TEST_SEEDS') == 'off':
+        return builder()
+
+    path = os.path.join(seed_dir, get_seed_key(name, builder) + '.json.gz')
+    last_pks = OrderedDict((model, get_last_pk(model)) for model in seed_models)
+    if os.path.exists(path):
+        objects = restore_snapshot(path, last_pks)
+        if objects is not None:
+            return objects
+
+    objects = list(builder())
+    save_snapshot(path, objects, last_pks)
+    return objects
+
 def log_hours_with_details(volunteer, shift, start, end):
     logged_shift = VolunteerShift.objects.create(
         shift = shift,
@@ -152,10 +505,7 @@ def create_country():
 
 def create_admin():
 
-    user_1 = User.objects.create_user(
-        username = 'admin',
-        password = 'admin'
-        )
+    user_1 = create_user_with_password('admin', 'admin')
 
     admin = Administrator.objects.create(
         user = user_1,
@@ -171,10 +521,7 @@ def create_admin():
 
 def create_volunteer():
 
-    user_1 = User.objects.create_user(
-        username = 'volunteer',
-        password = 'volunteer'
-        )
+    user_1 = create_user_with_password('volunteer', 'volunteer')
 
     volunteer = Volunteer.objects.create(
         user = user_1,
@@ -0,0 +1,26 @@
+"""
+Settings profile for running the test suites:
+
+    python manage.py test --settings=vms.settings_test
+
+Fixture users are created and logged in hundreds of times per run, so
+passwords are hashed with the fast MD5 hasher. Set VMS_TEST_REAL_HASHER=1 to
+keep Django's default hashers for the whole run; single classes can use
+`shift.utils.use_real_password_hasher` instead.
+"""
+
+import os
+
+from django.conf import global_settings
+
+from vms import settings
+
+# the profile extends every setting of vms.settings, Django only reads the
+# upper case names
+globals().update((name, getattr(settings, name))
+                 for name in dir(settings) if name.isupper())
+
+if os.environ.get('VMS_TEST_REAL_HASHER') != '1':
+    # the default hashers stay listed so existing hashes can still be checked
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher'] + \
+        list(global_settings.PASSWORD_HASHERS)
@@ -1,18 +1,18 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
+from pom.driverPool import driver_pool
 from pom.pages.authenticationPage import AuthenticationPage
 from pom.pages.volunteerSearchPage import VolunteerSearchPage
 
 from shift.utils import (
     create_admin,
-    create_volunteer_with_details
+    create_volunteers_in_bulk
     )
 
 
-class SearchVolunteer(LiveServerTestCase):
+class SearchVolunteer(BaseLiveServerTestCase):
     '''
     SearchVolunteer class contains tests to check '/voluneer/search/' view.
     Choices of parameters contains
@@ -27,18 +27,20 @@ class SearchVolunteer(LiveServerTestCase):
     obtained.
     '''
 
+    credentials = {'username': 'admin', 'password': 'admin'}
+
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Firefox()
-        cls.driver.implicitly_wait(5)
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.search_page = VolunteerSearchPage(cls.driver)
         cls.authentication_page = AuthenticationPage(cls.driver)
         super(SearchVolunteer, cls).setUpClass()
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         create_admin()
-        self.login_admin()
+
+    def setUp(self):
         self.search_page.get_page(self.live_server_url, self.search_page.volunteer_search_page)
 
     def tearDown(self):
@@ -46,29 +48,20 @@ class SearchVolunteer(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(SearchVolunteer, cls).tearDownClass()
 
-    def login_admin(self):
-        '''
-        Utility function to login an admin user to perform all tests.
-        '''
-        self.authentication_page.server_url = self.live_server_url
-        self.authentication_page.login({ 'username' : 'admin', 'password' : 'admin'})
-
     def test_volunteer_first_name_field(self):         
         credentials_1 = ['volunteer-username', 'VOLUNTEER-FIRST-NAME', 'volunteer-last-name',
                 'volunteer-address', 'volunteer-city', 'volunteer-state',
                 'volunteer-country', '9999999999', 'volunteer-email@systers.org',
                 'volunteer-organization']
 
-        v1 = create_volunteer_with_details(credentials_1)
-
         credentials_2 = ['volunteer-usernameq', 'volunteer-first-name', 'volunteer-last-nameq',
                 'volunteer-addressq', 'volunteer-cityq', 'volunteer-stateq', 'volunteer-countryq',
                 '9999999999', 'volunteer-email2@systers.orgq', 'volunteer-organizationq']
 
-        v2 = create_volunteer_with_details(credentials_2)
+        v1, v2 = create_volunteers_in_bulk([credentials_1, credentials_2])
 
         expected_result_one = credentials_1[1:-1]
         expected_result_two = credentials_2[1:-1]
@@ -112,12 +105,11 @@ class SearchVolunteer(LiveServerTestCase):
         credentials_1 = ['volunteer-username', 'volunteer-first-name', 'VOLUNTEER-LAST-NAME',
                 'volunteer-address', 'volunteer-city', 'volunteer-state', 'volunteer-country',
                 '9999999999', 'volunteer-email@systers.org','volunteer-organization']
-        v1 = create_volunteer_with_details(credentials_1)
 
         credentials_2 = ['volunteer-usernameq', 'volunteer-first-nameq', 'volunteer-last-name',
                 'volunteer-addressq', 'volunteer-cityq', 'volunteer-stateq', 'volunteer-countryq',
                 '9999999999', 'volunteer-email2@systers.orgq', 'volunteer-organizationq']
-        v2 = create_volunteer_with_details(credentials_2)
+        v1, v2 = create_volunteers_in_bulk([credentials_1, credentials_2])
 
         expected_result_one = credentials_1[1:-1]
         expected_result_two = credentials_2[1:-1]
@@ -162,13 +154,11 @@ class SearchVolunteer(LiveServerTestCase):
                 'volunteer-address', 'VOLUNTEER-CITY', 'volunteer-state', 'volunteer-country',
                 '9999999999', 'volunteer-email@systers.org', 'volunteer-organization']
 
-        v1 = create_volunteer_with_details(credentials_1)
-
         credentials_2 = ['volunteer-usernameq', 'volunteer-first-nameq', 'volunteer-last-nameq',
                 'volunteer-addressq', 'volunteer-city', 'volunteer-stateq', 'volunteer-countryq',
                 '9999999999', 'volunteer-email2@systers.orgq','volunteer-organizationq']
 
-        v2 = create_volunteer_with_details(credentials_2)
+        v1, v2 = create_volunteers_in_bulk([credentials_1, credentials_2])
 
         search_page = self.search_page
 
@@ -214,13 +204,11 @@ class SearchVolunteer(LiveServerTestCase):
                 'volunteer-address', 'volunteer-city', 'VOLUNTEER-STATE', 'volunteer-country',
                 '9999999999', 'volunteer-email@systers.org', 'volunteer-organization']
 
-        v1 = create_volunteer_with_details(credentials_1)
-
         credentials_2 = ['volunteer-usernameq', 'volunteer-first-nameq', 'volunteer-last-nameq',
                 'volunteer-addressq', 'volunteer-cityq', 'volunteer-state', 'volunteer-countryq',
                 '9999999999', 'volunteer-email2@systers.orgq', 'volunteer-organizationq']
 
-        v2 = create_volunteer_with_details(credentials_2)
+        v1, v2 = create_volunteers_in_bulk([credentials_1, credentials_2])
 
         search_page = self.search_page
 
@@ -266,13 +254,11 @@ class SearchVolunteer(LiveServerTestCase):
                 'volunteer-address', 'volunteer-city', 'volunteer-state', 'VOLUNTEER-COUNTRY',
                 '9999999999', 'volunteer-email@systers.org', 'volunteer-organization']
 
-        v1 = create_volunteer_with_details(credentials_1)
-
         credentials_2 = ['volunteer-usernameq', 'volunteer-first-nameq', 'volunteer-last-nameq',
                 'volunteer-addressq', 'volunteer-cityq', 'volunteer-stateq', 'volunteer-country',
                 '9999999999', 'volunteer-email2@systers.orgq', 'volunteer-organizationq']
 
-        v2 = create_volunteer_with_details(credentials_2)
+        v1, v2 = create_volunteers_in_bulk([credentials_1, credentials_2])
 
         search_page = self.search_page
 
@@ -318,13 +304,11 @@ class SearchVolunteer(LiveServerTestCase):
                 'volunteer-address', 'volunteer-city', 'volunteer-state', 'volunteer-country',
                 '9999999999', 'volunteer-email@systers.org']
 
-        v1 = create_volunteer_with_details(credentials_1)
-
         credentials_2 = ['volunteer-usernameq', 'volunteer-first-nameq', 'volunteer-last-nameq',
                 'volunteer-addressq', 'volunteer-cityq', 'volunteer-stateq', 'volunteer-countryq',
                 '9999999999', 'volunteer-email2@systers.orgq']
 
-        v2 = create_volunteer_with_details(credentials_2)
+        v1, v2 = create_volunteers_in_bulk([credentials_1, credentials_2])
 
         v2.unlisted_organization="volunteer-organization"
         v1.unlisted_organization="VOLUNTEER-ORGANIZATION"
@@ -382,13 +366,11 @@ class SearchVolunteer(LiveServerTestCase):
                 'volunteer-address', 'volunteer-city', 'volunteer-state', 'volunteer-country',
                 '9999999999', 'volunteer-email@systers.org']
 
-        v1 = create_volunteer_with_details(credentials_1)
-
         credentials_2 = ['volunteer-usernameq', 'volunteer-first-nameq', 'volunteer-last-nameq',
                 'volunteer-addressq', 'volunteer-cityq', 'volunteer-stateq', 'volunteer-countryq',
                 '9999999999', 'volunteer-email2@systers.orgq']
 
-        v2 = create_volunteer_with_details(credentials_2)
+        v1, v2 = create_volunteers_in_bulk([credentials_1, credentials_2])
 
         v2.unlisted_organization="volunteer-organization"
         v1.unlisted_organization="VOLUNTEER-ORGANIZATION"
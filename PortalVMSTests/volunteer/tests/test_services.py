@@ -1,7 +1,9 @@
 import unittest
 from organization.models import Organization
 from volunteer.models import Volunteer
-from shift.utils import create_volunteer_with_details, clear_objects
+from shift.benchmark import QueryBudget, assert_constant_queries
+from shift.utils import (begin_module_transaction, clear_objects,
+                         create_volunteers_in_bulk, seed_dataset)
 
 from volunteer.services import (delete_volunteer,
                                 delete_volunteer_resume,
@@ -12,18 +14,30 @@ from volunteer.services import (delete_volunteer,
                                 has_resume_file,
                                 search_volunteers)
 
+# Most queries each call of these services may run
+get_all_volunteers = QueryBudget(1)(get_all_volunteers)
+get_volunteer_by_id = QueryBudget(1)(get_volunteer_by_id)
+get_volunteers_ordered_by_first_name = QueryBudget(1)(
+    get_volunteers_ordered_by_first_name)
+search_volunteers = QueryBudget(1)(search_volunteers)
+
 
 class VolunteerMethodTests(unittest.TestCase):
 
-    @classmethod
-    def setUpClass(cls):
+    @staticmethod
+    def build_dataset():
         volunteer_1 = ['Yoshi',"Yoshi","Turtle","Mario Land","Nintendo Land","Nintendo State","Nintendo Nation","2374983247","yoshi@nintendo.com"]
         volunteer_2 = ['John',"John","Doe","7 Alpine Street","Maplegrove","Wyoming","USA","23454545","john@test.com"]
         volunteer_3 = ['Ash',"Ash","Doe","Pallet Town","Kanto","Gameboy","Japan","23454545","ash@pikachu.com"]
 
-        cls.v1 = create_volunteer_with_details(volunteer_1)
-        cls.v2 = create_volunteer_with_details(volunteer_2)
-        cls.v3 = create_volunteer_with_details(volunteer_3)
+        return create_volunteers_in_bulk(
+            [volunteer_1, volunteer_2, volunteer_3])
+
+    @classmethod
+    def setUpClass(cls):
+        begin_module_transaction()
+        cls.v1, cls.v2, cls.v3 = seed_dataset(
+            'volunteer_services', cls.build_dataset)
 
     @classmethod
     def tearDownClass(cls):
@@ -107,6 +121,19 @@ class VolunteerMethodTests(unittest.TestCase):
         self.assertEqual(volunteer_list[1], self.v2)
         self.assertEqual(volunteer_list[2], self.v1)
 
+    def test_get_volunteers_ordered_by_first_name_queries(self):
+
+        def build_args(size):
+            create_volunteers_in_bulk(
+                [["volunteer-%d-%d" % (size, index), "First", "Last",
+                  "address", "city", "state", "country", "9999999999",
+                  "volunteer-%d-%d@volunteer.com" % (size, index)]
+                 for index in range(size)])
+            return ()
+
+        assert_constant_queries(get_volunteers_ordered_by_first_name,
+                                build_args)
+
     def test_has_resume_file(self):
 
         self.v1.resume_file="MyResume.pdf"
@@ -204,9 +231,8 @@ class DeleteVolunteerTest(unittest.TestCase):
         volunteer_2 = ['Miu',"John","Doe","7 Alpine Street","Maplegrove","Wyoming","USA","23454545","john1@test.com"]
         volunteer_3 = ['Brock',"Ash","Ketchum","Pallet Town","Kanto","Gameboy","Japan","23454545","ash1@pikachu.com"]
 
-        cls.v1 = create_volunteer_with_details(volunteer_1)
-        cls.v2 = create_volunteer_with_details(volunteer_2)
-        cls.v3 = create_volunteer_with_details(volunteer_3)
+        cls.v1, cls.v2, cls.v3 = create_volunteers_in_bulk(
+            [volunteer_1, volunteer_2, volunteer_3])
 
     def test_delete_volunteer(self):
 
@@ -1,24 +1,22 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
 from volunteer.models import Volunteer
 from shift.utils import create_volunteer_with_details
 
+from pom.driverPool import driver_pool
 from pom.pages.authenticationPage import AuthenticationPage
 from pom.pages.volunteerProfilePage import VolunteerProfilePage
 
 import re
 
-class VolunteerProfile(LiveServerTestCase):
+class VolunteerProfile(BaseLiveServerTestCase):
     '''
     '''
     @classmethod
     def setUpClass(cls):       
-        cls.driver = webdriver.Firefox()
-        cls.driver.implicitly_wait(5)
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.profile_page = VolunteerProfilePage(cls.driver)
         cls.authentication_page = AuthenticationPage(cls.driver)
         super(VolunteerProfile, cls).setUpClass()
@@ -36,7 +34,7 @@ class VolunteerProfile(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(VolunteerProfile, cls).tearDownClass()
 
     def login_correctly(self):
@@ -1,8 +1,8 @@
-from django.contrib.staticfiles.testing import LiveServerTestCase
+from pom.baseTestCase import BaseLiveServerTestCase
 
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 
+from pom.driverPool import driver_pool
 from pom.pages.volunteerReportPage import VolunteerReportPage
 
 from shift.utils import (
@@ -13,14 +13,12 @@ from shift.utils import (
     log_hours_utility
     )
 
-class VolunteerReport(LiveServerTestCase):
+class VolunteerReport(BaseLiveServerTestCase):
     '''
     '''
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Firefox()
-        cls.driver.implicitly_wait(5)
-        cls.driver.maximize_window()
+        cls.driver = driver_pool.lease()
         cls.report_page = VolunteerReportPage(cls.driver)
         super(VolunteerReport, cls).setUpClass()
 
@@ -32,7 +30,7 @@ class VolunteerReport(LiveServerTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.driver.quit()
+        driver_pool.release(cls.driver)
         super(VolunteerReport, cls).tearDownClass()
 
     def verify_shift_details(self, total_shifts, hours):